@@ -33,4 +33,4 @@ fi
 
 # Start the API server
 cd /app
-exec python3 api_server.py
+exec gunicorn -c gunicorn_conf.py api_server:app
@@ -7,11 +7,16 @@ heating system status through browser automation using Selenium.
 """
 
 import os
+import re
 import time
 import logging
+import signal
+import socket
 import subprocess
+import threading
 import json
-from typing import Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, Future, wait as wait_futures
+from typing import Optional, Dict, Any, List, Tuple
 from dataclasses import dataclass
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -19,14 +24,299 @@ from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import TimeoutException, NoSuchElementException, WebDriverException
 from webdriver_manager.chrome import ChromeDriverManager
 import sys
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from src.config_manager import ConfigManager
+from src.presets import PRESETS
 from src.exceptions import EcobeeAutomationError
 
 
+# CSS selectors that are a single id, e.g. '#userName'
+_ID_SELECTOR = re.compile(r'#[A-Za-z][\w-]*')
+
+# Fallback locators for the login page probes. Each list is combined into one CSS
+# selector list so a probe is a single find_elements call and a miss costs one
+# timeout rather than one per selector.
+_EMAIL_INPUT = (By.CSS_SELECTOR, 'input[type="email"]')
+_PASSWORD_INPUT = (By.CSS_SELECTOR, 'input[type="password"]')
+_SIGNIN_LOCATOR = (By.CSS_SELECTOR, ', '.join((
+    'a[href*="login"]',
+    'a[href*="signin"]',
+    'a[href*="sign-in"]',
+    'button[id*="signin"]',
+    'a[id*="signin"]'
+)))
+_USERNAME_LOCATOR = (By.CSS_SELECTOR, ', '.join((
+    'input[type="email"]',
+    'input[type="text"][name*="user"]',
+    'input[type="text"][name*="email"]',
+    'input[id*="user"]',
+    'input[id*="email"]',
+    'input[name="username"]',
+    'input[name="email"]',
+    'input[placeholder*="email"]',
+    'input[placeholder*="username"]',
+    'input[autocomplete="username"]',
+    'input[autocomplete="email"]'
+)))
+_PASSWORD_LOCATOR = (By.CSS_SELECTOR, ', '.join((
+    'input[type="password"]',
+    'input[name="password"]',
+    'input[id*="password"]',
+    'input[id*="passwd"]',
+    'input[autocomplete="current-password"]',
+    'input[placeholder*="password"]'
+)))
+_LOGIN_BUTTON_LOCATOR = (By.CSS_SELECTOR, ', '.join((
+    'button[type="submit"]',
+    'input[type="submit"]',
+    'button[id*="login"]',
+    'button[id*="submit"]',
+    'button[class*="login"]',
+    'button[class*="submit"]',
+    'a[id*="login"]',
+    'input[value*="Log"]',
+    'input[value*="Sign"]'
+)))
+_NEXT_BUTTON_LOCATOR = (By.CSS_SELECTOR, ', '.join((
+    'button[id*="next"]',
+    'button[id*="continue"]',
+    'button[class*="next"]',
+    'button[class*="continue"]',
+    'input[type="submit"]',
+    'button[type="submit"]'
+)))
+
+# Third-party requests that play no part in login or thermostat control
+_BLOCKED_URLS = [
+    '*googletagmanager*',
+    '*google-analytics*',
+    '*doubleclick*',
+    '*segment.io*',
+    '*hotjar*',
+    '*fullstory*',
+    '*.woff2',
+    '*.woff',
+]
+
+# Resolved webdriver-manager chromedriver path, persisted across runs
+_DRIVER_PATH_CACHE = os.path.expanduser('~/.cache/ecobee_automation/chromedriver_path.json')
+
+# Error screenshots are written next to src/
+_SCREENSHOTS_DIR = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'screenshots'))
+
+
+def _debugger_reachable(address: str) -> bool:
+    """Check whether a Chrome remote debugging endpoint (host:port) accepts connections."""
+    host, _, port = address.rpartition(':')
+    try:
+        with socket.create_connection((host or '127.0.0.1', int(port)), timeout=0.5):
+            return True
+    except (OSError, ValueError):
+        return False
+
+
+def _chrome_major_version(chrome_binary: Optional[str] = None) -> Optional[str]:
+    """Return the installed Chrome/Chromium major version, or None if not found."""
+    for candidate in (chrome_binary, 'google-chrome', 'chromium', 'chromium-browser'):
+        if not candidate:
+            continue
+        try:
+            output = subprocess.run([candidate, '--version'], capture_output=True,
+                                    text=True, timeout=5).stdout
+        except (OSError, subprocess.SubprocessError):
+            continue
+        match = re.search(r'(\d+)\.', output)
+        if match:
+            return match.group(1)
+    return None
+
+
+# Reads the status elements in one CDP Runtime.evaluate call instead of one find_element each.
+# The first call on a page installs a MutationObserver that keeps window.__ecobeeState
+# current, so later calls just return that object.
+# Filled in with the JSON-encoded current_temp, target_temp and mode_selector CSS selectors.
+_READ_STATUS_JS = """
+(function (currentSelector, targetSelector, modeSelector) {
+    if (!window.__ecobeeObserver) {
+        const q = (s) => document.querySelector(s);
+        const snap = () => {
+            const ct = q(currentSelector), tt = q(targetSelector), md = q(modeSelector);
+            window.__ecobeeState = {
+                current: ct && ct.textContent,
+                target: tt && tt.textContent,
+                mode_attr: md && md.getAttribute('data-current-mode'),
+                mode_text: md && md.textContent
+            };
+        };
+        snap();
+        window.__ecobeeObserver = new MutationObserver(snap);
+        window.__ecobeeObserver.observe(document.body, {
+            subtree: true, childList: true, characterData: true, attributes: true
+        });
+    }
+    return window.__ecobeeState;
+})(%s, %s, %s)
+"""
+
+
+# Characters stripped from displayed temperatures in a single str.translate pass
+_TEMP_STRIP = str.maketrans('', '', '°F \t\n')
+
+
+# Collects the attributes _log_page_structure logs, for the first 10 inputs and buttons,
+# in one round trip instead of several get_attribute calls per element
+_PAGE_STRUCTURE_JS = """
+const inputs = document.querySelectorAll('input');
+const buttons = document.querySelectorAll('button');
+return {
+    input_count: inputs.length,
+    inputs: Array.from(inputs).slice(0, 10).map(e => ({
+        type: e.getAttribute('type'), name: e.name, id: e.id, placeholder: e.placeholder
+    })),
+    button_count: buttons.length,
+    buttons: Array.from(buttons).slice(0, 10).map(e => ({
+        text: e.innerText, type: e.getAttribute('type'), name: e.name, id: e.id
+    }))
+};
+"""
+
+# Counts the page's in-flight XMLHttpRequest and fetch calls (which covers
+# jQuery and Angular $http) in window.__ecobeeRequests. Safe to run repeatedly;
+# each run restarts the idle clock checked by _PAGE_READY_JS.
+_TRACK_REQUESTS_JS = """
+if (!window.__ecobeeRequests) {
+    const state = window.__ecobeeRequests = {pending: 0, last: Date.now()};
+    const start = () => { state.pending++; state.last = Date.now(); };
+    const done = () => { state.pending--; state.last = Date.now(); };
+    const send = XMLHttpRequest.prototype.send;
+    XMLHttpRequest.prototype.send = function () {
+        start();
+        this.addEventListener('loadend', done, {once: true});
+        return send.apply(this, arguments);
+    };
+    if (window.fetch) {
+        const fetch = window.fetch;
+        window.fetch = function () {
+            start();
+            return fetch.apply(this, arguments).finally(done);
+        };
+    }
+}
+window.__ecobeeRequests.last = Date.now();
+"""
+
+# True once the document has loaded, jQuery (when the page uses it) is idle
+# and, when requests are tracked, none has been in flight for arguments[0] ms
+_PAGE_READY_JS = """
+const requests = window.__ecobeeRequests;
+return document.readyState === 'complete'
+    && (!window.jQuery || window.jQuery.active === 0)
+    && (!requests || (requests.pending === 0 && Date.now() - requests.last >= arguments[0]));
+"""
+
+# Fallback mode detection: look for Aux or Heat anywhere in the page text
+_PAGE_MODE_JS = (
+    "const t = document.body.innerText.toLowerCase();"
+    "return t.includes('aux') ? 'aux' : (t.includes('heat') ? 'heat' : null);"
+)
+
+# Radio button whose value equals, or aria-label starts with, the lowercase
+# mode in arguments[0], or null. Returned as a WebElement.
+_MODE_RADIO_JS = """
+const mode = arguments[0];
+return Array.from(document.querySelectorAll('input[type=radio]')).find(r =>
+    (r.value || '').toLowerCase() === mode
+    || (r.getAttribute('aria-label') || '').toLowerCase().startsWith(mode)
+) || null;
+"""
+
+# First input whose type/name/id/placeholder/autocomplete contains one of the
+# lowercase keywords in arguments[0], or null. Returned as a WebElement.
+_MATCH_INPUT_JS = """
+const keywords = arguments[0];
+for (const e of document.querySelectorAll('input')) {
+    const attrs = [e.type, e.name, e.id, e.placeholder, e.autocomplete].join(' ').toLowerCase();
+    if (keywords.some(k => attrs.includes(k))) {
+        return e;
+    }
+}
+return null;
+"""
+
+
+# The System tile on a thermostat's page, matched by its label text
+_SYSTEM_TILE_LOCATOR = (By.XPATH, "//*[contains(text(), 'System') or contains(text(), 'SYSTEM')]")
+
+_UPPER = 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
+_LOWER = 'abcdefghijklmnopqrstuvwxyz'
+_CARD_CLASS = "(contains(@class, 'device') or contains(@class, 'thermostat') or contains(@class, 'card'))"
+
+
+def _text_xpath(tag: str, words: tuple) -> str:
+    """Build an XPath for tag elements whose text contains any of words, case-insensitively."""
+    text = f"translate(normalize-space(.), '{_UPPER}', '{_LOWER}')"
+    return f"//{tag}[" + " or ".join(f"contains({text}, '{word}')" for word in words) + "]"
+
+
+# Heat/Aux mode options, which only the System panel shows
+_MODE_OPTION_LOCATOR = (By.XPATH, _text_xpath('label', ('heat', 'aux')))
+_SUBMIT_TEXT_XPATH = _text_xpath('button', ('log in', 'sign in', 'login', 'signin', 'submit', 'continue'))
+_SIGNIN_LINK_XPATH = _text_xpath('a', ('sign in', 'log in', 'login'))
+_SIGNIN_BUTTON_XPATH = _text_xpath('button', ('sign in', 'log in'))
+
+
+def _xpath_literal(value: str) -> str:
+    """Quote a string for use in an XPath expression, whatever quotes it contains."""
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+def _thermostat_locators(thermostat_name: str) -> Tuple[tuple, ...]:
+    """Build locators matching, case-insensitively, the ways a thermostat is shown.
+    
+    In priority order: links containing the name, elements whose own text
+    contains it, and the innermost device/thermostat/card element containing it.
+    """
+    name = _xpath_literal(thermostat_name.lower())
+    has_name = f"contains(translate(., '{_UPPER}', '{_LOWER}'), {name})"
+    return (
+        (By.XPATH, f"//a[{has_name}]"),
+        (By.XPATH, f"//*[text()[{has_name}]]"),
+        (By.XPATH, f"//*[{_CARD_CLASS}][{has_name}][not(.//*[{_CARD_CLASS}][{has_name}])]"),
+    )
+
+
+# Elements matching an XPath (arguments[0] == 'xpath') or CSS query that are rendered,
+# and optionally not disabled, filtered in the page instead of one is_displayed() call each
+_VISIBLE_ELEMENTS_JS = """
+const [kind, query, requireEnabled] = arguments;
+let nodes;
+if (kind === 'xpath') {
+    const result = document.evaluate(query, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    nodes = Array.from({length: result.snapshotLength}, (_, i) => result.snapshotItem(i));
+} else {
+    nodes = Array.from(document.querySelectorAll(query));
+}
+return nodes.filter(e => (e.offsetParent || e.getClientRects().length) && !(requireEnabled && e.disabled));
+"""
+
+
+def _parse_temp(text: Optional[str]) -> Optional[float]:
+    """Parse a displayed temperature such as '72°F' into a float."""
+    if not text:
+        return None
+    try:
+        return float(text.translate(_TEMP_STRIP))
+    except ValueError:
+        return None
+
+
 @dataclass
 class HeatingStatus:
     """Data class to represent heating system status."""
@@ -46,9 +336,56 @@ class EcobeeAutomation:
         self.wait: Optional[WebDriverWait] = None
         self.logger = logging.getLogger(__name__)
         
+        # Tunables read once instead of on every use
+        self._delay = float(config_manager.get('automation.delay', 2))
+        self._session_max_age = float(config_manager.get('automation.session_max_age', 3600))
+        self._headless = bool(config_manager.get('webdriver.headless', False))
+        self._explicit_wait = float(config_manager.get('webdriver.explicit_wait', 10))
+        self._page_load_timeout = int(config_manager.get('webdriver.page_load_timeout', 30))
+        self._script_timeout = int(config_manager.get('webdriver.script_timeout', 10))
+        self._thermostat_name = config_manager.get('ecobee.thermostat_name', 'Main Floor')
+        
+        # Time of the last successful login, used to reuse the session
+        self._logged_in_at: Optional[float] = None
+        
+        # Last URL loaded by this class; None once a click may have navigated away
+        self._current_url: Optional[str] = None
+        
+        # Thermostat whose page is showing, when it was opened, and whether its
+        # System panel has been opened on top of it
+        self._current_thermostat: Optional[str] = None
+        self._thermostat_opened_at = 0.0
+        self._system_panel_open = False
+        self._nav_cache_ttl = float(config_manager.get('automation.nav_cache_ttl', 30))
+        
+        # WebDriverWait instances for the current driver, keyed by timeout
+        self._waits: Dict[float, WebDriverWait] = {}
+        
+        # Parsed 1Password items: name -> (fetch time, fields), reused within one TOTP period
+        self._op_items: Dict[str, Tuple[float, Dict[str, Optional[str]]]] = {}
+        
+        # Without configured credentials, start the 1Password lookup now so it
+        # runs while chromedriver is resolved and Chrome starts
+        self._creds_future: Optional[Future] = None
+        op_item = config_manager.get('ecobee.onepassword_item')
+        if op_item and not config_manager.has_required(['ecobee.username', 'ecobee.password']):
+            creds_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ecobee-1password')
+            self._creds_future = creds_executor.submit(self._get_credentials_from_1password, op_item)
+            creds_executor.shutdown(wait=False)
+        
+        # Screenshots are saved in the background so error paths don't wait on them
+        self._screenshot_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='ecobee-screenshot')
+        self._screenshot_futures: List[Future] = []
+        self._screenshot_enabled = bool(config_manager.get('automation.screenshot_on_error', True))
+        if self._screenshot_enabled:
+            os.makedirs(_SCREENSHOTS_DIR, exist_ok=True)
+        
         # Ecobee web interface URLs and selectors
         self.login_url = "https://auth.ecobee.com/u/login"
         self.portal_url = "https://www.ecobee.com/home/index.html"
+        self.devices_url = config_manager.get(
+            'ecobee.devices_url', "https://www.ecobee.com/consumerportal/index.html#/devices"
+        )
         
         # Common selectors (these may need to be updated based on actual UI)
         self.selectors = {
@@ -67,17 +404,40 @@ class EcobeeAutomation:
             'temp_down': '.temp-down',
             'save_button': '.save-changes'
         }
+        
+        # Locator tuples built once so call sites don't rebuild them; plain '#id'
+        # selectors use By.ID so they skip CSS selector parsing
+        self._locators = {
+            key: (By.ID, selector[1:]) if _ID_SELECTOR.fullmatch(selector) else (By.CSS_SELECTOR, selector)
+            for key, selector in self.selectors.items()
+        }
+        self._status_expression = _READ_STATUS_JS % tuple(
+            json.dumps(self.selectors[key]) for key in ('current_temp', 'target_temp', 'mode_selector')
+        )
 
     def setup_driver(self) -> None:
         """Set up Chrome WebDriver with appropriate options."""
         try:
+            # Attach to an already running Chrome (started with
+            # --remote-debugging-port and a persistent --user-data-dir) when
+            # one is configured and listening, keeping its session and open page
+            debugger_address = self.config.get('webdriver.debugger_address')
+            if debugger_address and _debugger_reachable(debugger_address):
+                chrome_options = Options()
+                chrome_options.debugger_address = debugger_address
+                chrome_options.page_load_strategy = 'eager'
+                self._start_driver(chrome_options, os.environ.get('CHROME_BIN'))
+                self._current_url = self.driver.current_url
+                self.logger.info(f"Attached to running Chrome at {debugger_address}")
+                return
+            
             chrome_options = Options()
             
-            headless = self.config.get('webdriver.headless', False)
-            self.logger.info(f"Headless mode: {headless} (type: {type(headless)})")
+            headless = self._headless
+            self.logger.debug(f"Headless mode: {headless} (type: {type(headless)})")
             
             if headless:
-                chrome_options.add_argument('--headless')
+                chrome_options.add_argument('--headless=new')
                 self.logger.info("Running in headless mode")
             else:
                 self.logger.info("Running with visible browser")
@@ -88,6 +448,24 @@ class EcobeeAutomation:
             chrome_options.add_argument('--window-size=1920,1080')
             chrome_options.add_argument('--user-agent=Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36')
             chrome_options.add_argument('--remote-debugging-port=0')
+            chrome_options.add_argument('--disable-extensions')
+            chrome_options.add_argument('--disable-background-networking')
+            
+            # Persist the profile so the portal session cookie survives between runs
+            profile_dir = self.config.get('webdriver.profile_dir', '~/.cache/ecobee_automation/chrome-profile')
+            if profile_dir:
+                chrome_options.add_argument(f'--user-data-dir={os.path.expanduser(profile_dir)}')
+                chrome_options.add_argument('--profile-directory=Default')
+            
+            # Only the DOM is needed: skip images and notification prompts,
+            # and return from driver.get() at DOMContentLoaded
+            if self.config.get('webdriver.block_images', True):
+                chrome_options.add_argument('--blink-settings=imagesEnabled=false')
+                chrome_options.add_experimental_option('prefs', {
+                    'profile.managed_default_content_settings.images': 2,
+                    'profile.default_content_setting_values.notifications': 2,
+                })
+            chrome_options.page_load_strategy = 'eager'
             
             # Detect Chrome/Chromium binary location
             chrome_binary = os.environ.get('CHROME_BIN')
@@ -95,52 +473,145 @@ class EcobeeAutomation:
                 chrome_options.binary_location = chrome_binary
                 self.logger.info(f"Using Chrome binary: {chrome_binary}")
             
-            # Get chromedriver path
-            chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
-            if chromedriver_path and os.path.exists(chromedriver_path):
-                driver_path = chromedriver_path
-                self.logger.info(f"Using chromedriver from environment: {driver_path}")
-            else:
-                # Fall back to webdriver-manager
-                driver_path = ChromeDriverManager().install()
-                
-                # Workaround for webdriver-manager bug that points to wrong file
-                if 'THIRD_PARTY_NOTICES' in driver_path or 'LICENSE' in driver_path:
-                    # Extract the directory and point to actual chromedriver
-                    driver_dir = os.path.dirname(driver_path)
-                    driver_path = os.path.join(driver_dir, 'chromedriver')
-                    self.logger.info(f"Fixed chromedriver path to: {driver_path}")
-            
-            service = Service(driver_path)
-            self.driver = webdriver.Chrome(service=service, options=chrome_options)
-            
-            # Set timeouts
-            self.driver.implicitly_wait(self.config.get('webdriver.implicit_wait', 10))
-            self.driver.set_page_load_timeout(self.config.get('webdriver.page_load_timeout', 30))
-            
-            self.wait = WebDriverWait(self.driver, 10)
-            self.logger.info("WebDriver setup completed successfully")
+            self._start_driver(chrome_options, chrome_binary)
             
         except Exception as e:
             self.logger.error(f"Failed to setup WebDriver: {e}")
             raise EcobeeAutomationError(f"WebDriver setup failed: {e}")
 
-    def login(self) -> bool:
-        """Log into the ecobee web portal."""
+    def _start_driver(self, chrome_options: Options, chrome_binary: Optional[str]) -> None:
+        """Start chromedriver with the given options and apply session settings.
+        
+        Args:
+            chrome_options: Options for the new session
+            chrome_binary: Chrome/Chromium binary used to pick a chromedriver version
+        """
+        # Get chromedriver path
+        chromedriver_path = os.environ.get('CHROMEDRIVER_PATH')
+        if chromedriver_path and os.path.exists(chromedriver_path):
+            driver_path = chromedriver_path
+            self.logger.info(f"Using chromedriver from environment: {driver_path}")
+        else:
+            # Fall back to webdriver-manager
+            driver_path = self._install_chromedriver(chrome_binary)
+        
+        # Start chromedriver in its own process group so kill() can take Chrome down with it
+        service = Service(driver_path, popen_kw={'start_new_session': True})
+        self.driver = webdriver.Chrome(service=service, options=chrome_options)
+        
+        # Set timeouts. Implicit waits are disabled: mixed with explicit waits they
+        # compound, and every miss in a find_element probe would block for the full
+        # timeout. Wait for elements with self.wait / WebDriverWait instead.
+        self.driver.implicitly_wait(0)
+        self.driver.set_page_load_timeout(self._page_load_timeout)
+        self.driver.set_script_timeout(self._script_timeout)
+        
+        if self.config.get('webdriver.block_trackers', True):
+            self.driver.execute_cdp_cmd('Network.enable', {})
+            self.driver.execute_cdp_cmd('Network.setBlockedURLs', {'urls': _BLOCKED_URLS})
+        
+        self._waits = {}
+        self.wait = self._get_wait(self._explicit_wait)
+        self.logger.info("WebDriver setup completed successfully")
+
+    def _install_chromedriver(self, chrome_binary: Optional[str] = None) -> str:
+        """Resolve chromedriver via webdriver-manager, reusing the path cached on disk.
+        
+        ChromeDriverManager().install() does a network version check on every call,
+        so the resolved path is cached per Chrome major version and only looked up
+        again when Chrome is updated or the cached binary disappears.
+        
+        Args:
+            chrome_binary: Chrome/Chromium binary used for the version check
+            
+        Returns:
+            Path to the chromedriver executable
+        """
+        chrome_version = _chrome_major_version(chrome_binary)
+        
+        cached_path = None
+        try:
+            with open(_DRIVER_PATH_CACHE) as f:
+                cached = json.load(f)
+            if cached.get('path') and os.access(cached['path'], os.X_OK):
+                cached_path = cached['path']
+                if cached.get('chrome_major_version') == chrome_version:
+                    self.logger.info(f"Using cached chromedriver: {cached_path}")
+                    return cached_path
+        except (OSError, ValueError, AttributeError):
+            pass
+        
+        try:
+            driver_path = ChromeDriverManager().install()
+        except Exception as e:
+            # Offline or rate limited: a driver for an older Chrome is better than none
+            if cached_path is None:
+                raise
+            self.logger.warning(f"chromedriver lookup failed ({e}), using cached {cached_path}")
+            return cached_path
+        
+        # Workaround for webdriver-manager bug that points to wrong file
+        if 'THIRD_PARTY_NOTICES' in driver_path or 'LICENSE' in driver_path:
+            # Extract the directory and point to actual chromedriver
+            driver_dir = os.path.dirname(driver_path)
+            driver_path = os.path.join(driver_dir, 'chromedriver')
+            self.logger.info(f"Fixed chromedriver path to: {driver_path}")
+        
+        try:
+            os.makedirs(os.path.dirname(_DRIVER_PATH_CACHE), exist_ok=True)
+            with open(_DRIVER_PATH_CACHE, 'w') as f:
+                json.dump({'chrome_major_version': chrome_version, 'path': driver_path}, f)
+        except OSError as e:
+            self.logger.warning(f"Could not cache chromedriver path: {e}")
+        
+        return driver_path
+
+    def login(self, force: bool = False) -> bool:
+        """Log into the ecobee web portal.
+        
+        Args:
+            force: Clear saved cookies and log in even if the session is still valid
+        """
         try:
             self.logger.info("Attempting to log into ecobee portal")
+            self._logged_in_at = None
+            
+            # A persisted profile may still hold a valid session; skip the login form
+            # (and the credential lookup) if the portal doesn't bounce us to auth
+            if force:
+                self._clear_ecobee_cookies()
+            elif self._session_valid():
+                self.logger.info("Existing session is still valid, skipping login")
+                self._logged_in_at = time.time()
+                return True
             
-            # Get credentials from configuration (.secrets file)
+            # Get credentials from configuration (.secrets file), else from 1Password
             username = self.config.get('ecobee.username')
             password = self.config.get('ecobee.password')
+            op_item = self.config.get('ecobee.onepassword_item')
+            if (not username or not password) and op_item:
+                creds = None
+                if self._creds_future is not None:
+                    try:
+                        creds = self._creds_future.result(timeout=15)
+                    except Exception as e:
+                        self.logger.warning(f"1Password prefetch failed: {e}")
+                    if not creds:
+                        # Don't keep reusing a failed prefetch for the life of the process
+                        self._creds_future = None
+                if not creds:
+                    creds = self._get_credentials_from_1password(op_item)
+                if creds:
+                    username, password = creds['username'], creds['password']
             
             if not username or not password:
                 self.logger.error("Username or password not configured")
                 return False
             
-            self.driver.get(self.login_url)
+            self._goto(self.login_url, force=True)
             self.logger.info(f"Navigated to: {self.driver.current_url}")
-            time.sleep(3)  # Wait for page to fully load
+            # Wait for the login form to render rather than for the whole page
+            self._wait_until(EC.presence_of_element_located((By.TAG_NAME, 'input')), timeout=10)
             
             # Debug: Log page structure
             self._log_page_structure()
@@ -154,9 +625,7 @@ class EcobeeAutomation:
                 return False
             
             self.logger.info("Found username field, entering email...")
-            username_field.clear()
-            username_field.send_keys(username)
-            time.sleep(1)
+            self._set_input_value(username_field, username)
             
             # Check if password field is visible (single page login) or if we need to click Continue
             password_visible = False
@@ -176,7 +645,8 @@ class EcobeeAutomation:
                     self.logger.info("Clicking Continue button...")
                     # Use JavaScript click to avoid interception issues
                     self.driver.execute_script("arguments[0].click();", continue_button)
-                    time.sleep(3)  # Wait for password page to load
+                    # Wait for the password page to show its field
+                    self._wait_until(EC.visibility_of_element_located(_PASSWORD_INPUT), timeout=10)
                 else:
                     self.logger.error("Could not find Continue button")
                     self._take_screenshot("continue_button_not_found")
@@ -191,9 +661,7 @@ class EcobeeAutomation:
                 return False
             
             self.logger.info("Found password field, entering password...")
-            password_field.clear()
-            password_field.send_keys(password)
-            time.sleep(1)
+            self._set_input_value(password_field, password)
             
             # Find and click submit button
             self.logger.info("Looking for submit button...")
@@ -206,18 +674,25 @@ class EcobeeAutomation:
             self.logger.info("Found submit button, clicking...")
             submit_button.click()
             
-            # Wait for login to complete
-            time.sleep(2)
-            self.logger.info(f"After login, current URL: {self.driver.current_url}")
+            # Wait for the redirect to the portal or for the device list to render,
+            # whichever comes first
+            self._wait_until(EC.any_of(
+                EC.url_contains('/consumerportal/'),
+                EC.url_contains('/home/'),
+                EC.presence_of_element_located(self._locators['thermostat_card'])
+            ), timeout=7)
+            self._current_url = self.driver.current_url
+            self.logger.info(f"After login, current URL: {self._current_url}")
             
             # Check if login was successful (URL should change to consumerportal)
-            if 'auth.ecobee.com' in self.driver.current_url.lower():
+            if 'auth.ecobee.com' in self._current_url.lower():
                 self.logger.warning("Still on auth page, login may have failed")
                 self._take_screenshot("login_verification_needed")
-                # Don't fail immediately, might just need more time
-                time.sleep(5)
+                # Don't fail immediately, the redirect might still be in progress
+                self._current_url = None
             
             self.logger.info("Login successful")
+            self._logged_in_at = time.time()
             return True
             
         except Exception as e:
@@ -225,6 +700,149 @@ class EcobeeAutomation:
             self._take_screenshot("login_error")
             return False
 
+    def _clear_ecobee_cookies(self) -> None:
+        """Delete the browser's ecobee cookies, leaving other sites' cookies alone.
+        
+        The profile may be persisted or be the user's own Chrome (see
+        webdriver.debugger_address), so clearing every cookie would sign
+        unrelated sites out.
+        """
+        cookies = self.driver.execute_cdp_cmd('Network.getAllCookies', {}).get('cookies', [])
+        for cookie in cookies:
+            domain = cookie['domain'].lstrip('.')
+            if domain == 'ecobee.com' or domain.endswith('.ecobee.com'):
+                self.driver.execute_cdp_cmd('Network.deleteCookies', {
+                    'name': cookie['name'], 'domain': cookie['domain'], 'path': cookie['path'],
+                })
+
+    def _session_valid(self) -> bool:
+        """Check whether the browser already has a logged-in portal session.
+        
+        Loads portal_url and waits up to 3s for it to settle on the consumer
+        portal or redirect to the auth page; anything else counts as logged out.
+        
+        Returns:
+            bool: True if the portal was reached without a login redirect
+        """
+        self._goto(self.portal_url, force=True)
+        self._wait_until(EC.any_of(
+            EC.url_contains('consumerportal'),
+            EC.url_contains('auth.ecobee.com')
+        ), timeout=3)
+        self._current_url = self.driver.current_url
+        url = self._current_url.lower()
+        return 'consumerportal' in url and 'auth.ecobee.com' not in url
+
+    def _set_input_value(self, field, value: str) -> None:
+        """Fill an input in one round trip instead of clear() plus per-key send_keys.
+        
+        Fires input and change events so the form sees the new value.
+        """
+        self.driver.execute_script(
+            "arguments[0].value = arguments[1];"
+            "arguments[0].dispatchEvent(new Event('input', {bubbles: true}));"
+            "arguments[0].dispatchEvent(new Event('change', {bubbles: true}));",
+            field, value
+        )
+
+    def ensure_logged_in(self, force: bool = False) -> bool:
+        """Make sure the browser is running and logged into the ecobee portal.
+        
+        The driver is started on first use and an existing login is reused
+        until it is older than automation.session_max_age or the portal has
+        redirected back to the auth page.
+        
+        Args:
+            force: Log in again even if the current session looks valid
+            
+        Returns:
+            bool: True if the session is logged in
+        """
+        if self.driver is not None and not self._driver_alive():
+            self.logger.warning("Browser is no longer usable, starting a new one")
+            self.kill()
+        
+        if self.driver is None:
+            self.setup_driver()
+            self._logged_in_at = None
+        
+        if not force and self._logged_in_at is not None:
+            session_age = time.time() - self._logged_in_at
+            if (session_age < self._session_max_age
+                    and 'auth.ecobee.com' not in self.driver.current_url.lower()):
+                return True
+            self.logger.info("Session expired, logging in again")
+        
+        return self.login(force=force)
+
+    def _driver_alive(self) -> bool:
+        """Check that chromedriver is running and its browser still answers.
+        
+        Chrome can crash while chromedriver stays up; the session then fails
+        every command (e.g. InvalidSessionIdException), so one cheap command
+        is sent to find out.
+        """
+        process = self.driver.service.process if self.driver else None
+        if process is None or process.poll() is not None:
+            return False
+        try:
+            self.driver.current_url
+            return True
+        except WebDriverException as e:
+            self.logger.warning(f"Browser session is not responding: {e}")
+            return False
+
+    def _get_op_item(self, item_name: str) -> Optional[Dict[str, Optional[str]]]:
+        """
+        Retrieve username, password and TOTP from 1Password with one CLI call.
+        
+        The result is reused until the current 30-second TOTP period ends, so
+        the credential and TOTP lookups of one login share a single op call.
+        
+        Args:
+            item_name: Name of the 1Password item
+            
+        Returns:
+            Dict with 'username', 'password' and 'totp' keys, None on failure
+        """
+        cached = self._op_items.get(item_name)
+        if cached and int(cached[0] // 30) == int(time.time() // 30):
+            return cached[1]
+        
+        try:
+            result = subprocess.run(
+                ['op', 'item', 'get', item_name, '--format=json', '--reveal'],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            if result.returncode != 0:
+                self.logger.warning(f"1Password CLI error: {result.stderr.strip()}")
+                return None
+            
+            fields = json.loads(result.stdout).get('fields', [])
+        except subprocess.TimeoutExpired:
+            self.logger.error("1Password CLI timed out")
+            return None
+        except FileNotFoundError:
+            self.logger.debug("1Password CLI not found")
+            return None
+        except (ValueError, AttributeError) as e:
+            self.logger.warning(f"Could not parse 1Password item JSON: {e}")
+            return None
+        
+        item = {'username': None, 'password': None, 'totp': None}
+        for field in fields:
+            if field.get('type') == 'OTP':
+                item['totp'] = field.get('totp')
+                continue
+            purpose = (field.get('purpose') or field.get('id') or '').lower()
+            if purpose in ('username', 'password'):
+                item[purpose] = field.get('value')
+        
+        self._op_items[item_name] = (time.time(), item)
+        return item
+
     def _get_totp_from_1password(self, item_name: str = "ecobee") -> Optional[str]:
         """
         Retrieve TOTP code from 1Password CLI.
@@ -235,6 +853,13 @@ class EcobeeAutomation:
         Returns:
             TOTP code if successful, None otherwise
         """
+        item = self._get_op_item(item_name)
+        totp_code = item and item['totp']
+        if totp_code and totp_code.isdigit() and len(totp_code) == 6:
+            self.logger.info("Successfully retrieved TOTP from 1Password")
+            return totp_code
+        
+        # Fall back to the dedicated --otp lookup
         try:
             # Get TOTP using --otp flag
             result = subprocess.run(
@@ -276,26 +901,34 @@ class EcobeeAutomation:
         Returns:
             Dict with 'username' and 'password' keys if successful, None otherwise
         """
+        item = self._get_op_item(item_name)
+        if item and item['username'] and item['password']:
+            self.logger.info("Successfully retrieved credentials from 1Password")
+            return {'username': item['username'], 'password': item['password']}
+        
+        # Fall back to separate field lookups
+        processes = []
         try:
-            # Get username using field id
-            username_result = subprocess.run(
-                ['op', 'item', 'get', item_name, '--fields', 'username'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
-            
-            # Get password using field id with --reveal flag
-            password_result = subprocess.run(
-                ['op', 'item', 'get', item_name, '--fields', 'password', '--reveal'],
-                capture_output=True,
-                text=True,
-                timeout=10
-            )
+            # Start the username and password lookups together; they are independent
+            # and each one pays the op CLI startup and a network round trip
+            for args in (['--fields', 'username'], ['--fields', 'password', '--reveal']):
+                processes.append(subprocess.Popen(
+                    ['op', 'item', 'get', item_name, *args],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    text=True
+                ))
+            
+            # Both are already running, so the total wait is the slower of the two
+            deadline = time.monotonic() + 10
+            (username_out, username_err), (password_out, password_err) = [
+                proc.communicate(timeout=max(deadline - time.monotonic(), 0)) for proc in processes
+            ]
+            username_proc, password_proc = processes
             
-            if username_result.returncode == 0 and password_result.returncode == 0:
-                username = username_result.stdout.strip()
-                password = password_result.stdout.strip()
+            if username_proc.returncode == 0 and password_proc.returncode == 0:
+                username = username_out.strip()
+                password = password_out.strip()
                 
                 if username and password:
                     self.logger.info("Successfully retrieved credentials from 1Password")
@@ -304,13 +937,16 @@ class EcobeeAutomation:
                     self.logger.warning("Retrieved empty username or password from 1Password")
                     return None
             else:
-                username_err = username_result.stderr.strip() if username_result.returncode != 0 else ""
-                password_err = password_result.stderr.strip() if password_result.returncode != 0 else ""
+                username_err = username_err.strip() if username_proc.returncode != 0 else ""
+                password_err = password_err.strip() if password_proc.returncode != 0 else ""
                 self.logger.warning(f"1Password CLI error - Username: {username_err}, Password: {password_err}")
                 return None
                 
         except subprocess.TimeoutExpired:
             self.logger.error("1Password CLI timed out")
+            for proc in processes:
+                proc.kill()
+                proc.communicate()
             return None
         except FileNotFoundError:
             self.logger.debug("1Password CLI not found")
@@ -322,26 +958,30 @@ class EcobeeAutomation:
 
     def _log_page_structure(self) -> None:
         """Log the structure of input fields and buttons on the current page for debugging."""
+        # Only useful at DEBUG level; skip the browser round trip otherwise
+        if not self.logger.isEnabledFor(logging.DEBUG):
+            return
+        
         try:
-            # Log all input fields
-            inputs = self.driver.find_elements(By.TAG_NAME, 'input')
-            self.logger.info(f"Found {len(inputs)} input fields on page:")
-            for i, inp in enumerate(inputs[:10]):  # Limit to first 10
-                input_type = inp.get_attribute('type') or 'text'
-                input_name = inp.get_attribute('name') or 'no-name'
-                input_id = inp.get_attribute('id') or 'no-id'
-                input_placeholder = inp.get_attribute('placeholder') or 'no-placeholder'
-                self.logger.info(f"  Input {i}: type={input_type}, name={input_name}, id={input_id}, placeholder={input_placeholder}")
-            
-            # Log all buttons
-            buttons = self.driver.find_elements(By.TAG_NAME, 'button')
-            self.logger.info(f"Found {len(buttons)} buttons on page:")
-            for i, btn in enumerate(buttons[:10]):  # Limit to first 10
-                btn_text = btn.text or 'no-text'
-                btn_type = btn.get_attribute('type') or 'button'
-                btn_name = btn.get_attribute('name') or 'no-name'
-                btn_id = btn.get_attribute('id') or 'no-id'
-                self.logger.info(f"  Button {i}: text='{btn_text}', type={btn_type}, name={btn_name}, id={btn_id}")
+            structure = self.driver.execute_script(_PAGE_STRUCTURE_JS)
+            
+            # Log all input fields (first 10)
+            self.logger.debug(f"Found {structure['input_count']} input fields on page:")
+            for i, inp in enumerate(structure['inputs']):
+                input_type = inp['type'] or 'text'
+                input_name = inp['name'] or 'no-name'
+                input_id = inp['id'] or 'no-id'
+                input_placeholder = inp['placeholder'] or 'no-placeholder'
+                self.logger.debug(f"  Input {i}: type={input_type}, name={input_name}, id={input_id}, placeholder={input_placeholder}")
+            
+            # Log all buttons (first 10)
+            self.logger.debug(f"Found {structure['button_count']} buttons on page:")
+            for i, btn in enumerate(structure['buttons']):
+                btn_text = btn['text'] or 'no-text'
+                btn_type = btn['type'] or 'button'
+                btn_name = btn['name'] or 'no-name'
+                btn_id = btn['id'] or 'no-id'
+                self.logger.debug(f"  Button {i}: text='{btn_text}', type={btn_type}, name={btn_name}, id={btn_id}")
                 
         except Exception as e:
             self.logger.debug(f"Error logging page structure: {e}")
@@ -352,8 +992,8 @@ class EcobeeAutomation:
             # Try finding by exact type first
             if 'email' in keywords:
                 try:
-                    field = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="email"]'))
+                    field = self._get_wait(timeout).until(
+                        EC.presence_of_element_located(_EMAIL_INPUT)
                     )
                     self.logger.info(f"Found field by type=email")
                     return field
@@ -362,30 +1002,19 @@ class EcobeeAutomation:
             
             if 'password' in keywords:
                 try:
-                    field = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, 'input[type="password"]'))
+                    field = self._get_wait(timeout).until(
+                        EC.presence_of_element_located(_PASSWORD_INPUT)
                     )
                     self.logger.info(f"Found field by type=password")
                     return field
                 except TimeoutException:
                     pass
             
-            # Try all input fields and match by attributes
-            inputs = self.driver.find_elements(By.TAG_NAME, 'input')
-            for inp in inputs:
-                # Check if any keyword appears in any attribute
-                input_type = (inp.get_attribute('type') or '').lower()
-                input_name = (inp.get_attribute('name') or '').lower()
-                input_id = (inp.get_attribute('id') or '').lower()
-                input_placeholder = (inp.get_attribute('placeholder') or '').lower()
-                input_autocomplete = (inp.get_attribute('autocomplete') or '').lower()
-                
-                all_attrs = f"{input_type} {input_name} {input_id} {input_placeholder} {input_autocomplete}"
-                
-                for keyword in keywords:
-                    if keyword.lower() in all_attrs:
-                        self.logger.info(f"Found field matching keyword '{keyword}' in attributes: {all_attrs}")
-                        return inp
+            # Match all input fields by attributes in the browser in one round trip
+            field = self.driver.execute_script(_MATCH_INPUT_JS, [k.lower() for k in keywords])
+            if field is not None:
+                self.logger.info(f"Found field matching keywords: {keywords}")
+                return field
             
             self.logger.error(f"Could not find input field matching keywords: {keywords}")
             return None
@@ -412,19 +1041,17 @@ class EcobeeAutomation:
             except NoSuchElementException:
                 pass
             
-            # Search buttons by text content
-            buttons = self.driver.find_elements(By.TAG_NAME, 'button')
-            for btn in buttons:
-                btn_text = (btn.text or '').lower()
-                if any(word in btn_text for word in ['log in', 'sign in', 'login', 'signin', 'submit', 'continue']):
-                    self.logger.info(f"Found button by text: '{btn.text}'")
-                    return btn
+            # Search buttons by text content, matched in the browser
+            matches = self.driver.find_elements(By.XPATH, _SUBMIT_TEXT_XPATH)
+            if matches:
+                self.logger.info(f"Found button by text: '{matches[0].text}'")
+                return matches[0]
             
             # If still not found, return first visible button
-            for btn in buttons:
-                if btn.is_displayed() and btn.is_enabled():
-                    self.logger.info(f"Using first visible button: '{btn.text}'")
-                    return btn
+            buttons = self._visible_elements((By.TAG_NAME, 'button'), require_enabled=True)
+            if buttons:
+                self.logger.info(f"Using first visible button: '{buttons[0].text}'")
+                return buttons[0]
             
             self.logger.error("Could not find submit button")
             return None
@@ -437,48 +1064,22 @@ class EcobeeAutomation:
         """Navigate to the sign-in page by clicking the sign-in menu."""
         try:
             # Look for "Sign In" link or button in navigation
-            signin_selectors = [
-                'a[href*="login"]',
-                'a[href*="signin"]',
-                'a[href*="sign-in"]',
-                'button[id*="signin"]',
-                'a[id*="signin"]'
-            ]
+            signin_link = self._find_clickable(_SIGNIN_LOCATOR, 3)
+            if signin_link:
+                self.logger.info("Found sign-in link by selector")
+                signin_link.click()
+                return True
             
-            for selector in signin_selectors:
+            # Try finding by link text, then button text
+            for kind, xpath in (('link', _SIGNIN_LINK_XPATH), ('button', _SIGNIN_BUTTON_XPATH)):
                 try:
-                    signin_link = WebDriverWait(self.driver, 3).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    self.logger.info(f"Found sign-in link using selector: {selector}")
-                    signin_link.click()
-                    return True
-                except (TimeoutException, NoSuchElementException):
-                    continue
-            
-            # Try finding by link text
-            try:
-                links = self.driver.find_elements(By.TAG_NAME, 'a')
-                for link in links:
-                    text = link.text.lower().strip()
-                    if 'sign in' in text or 'log in' in text or 'login' in text:
-                        self.logger.info(f"Found sign-in link by text: {link.text}")
-                        link.click()
-                        return True
-            except Exception as e:
-                self.logger.debug(f"Error finding sign-in by link text: {e}")
-            
-            # Try finding buttons
-            try:
-                buttons = self.driver.find_elements(By.TAG_NAME, 'button')
-                for button in buttons:
-                    text = button.text.lower().strip()
-                    if 'sign in' in text or 'log in' in text:
-                        self.logger.info(f"Found sign-in button by text: {button.text}")
-                        button.click()
+                    matches = self.driver.find_elements(By.XPATH, xpath)
+                    if matches:
+                        self.logger.info(f"Found sign-in {kind} by text: {matches[0].text}")
+                        matches[0].click()
                         return True
-            except Exception as e:
-                self.logger.debug(f"Error finding sign-in by button text: {e}")
+                except Exception as e:
+                    self.logger.debug(f"Error finding sign-in by {kind} text: {e}")
             
             self.logger.warning("Could not find sign-in link, assuming already on login page")
             return True  # Continue anyway, might already be on login page
@@ -487,46 +1088,56 @@ class EcobeeAutomation:
             self.logger.error(f"Error navigating to sign-in: {e}")
             return True  # Continue anyway
 
-    def _find_login_field(self, field_type: str, timeout: int = 2):
+    def _visible_elements(self, locator: tuple, require_enabled: bool = False) -> list:
+        """Find the visible elements matching a locator in one round trip.
+        
+        Args:
+            locator: (By, query) tuple using By.XPATH, By.CSS_SELECTOR or By.TAG_NAME
+            require_enabled: Also drop disabled elements
+            
+        Returns:
+            List of matching visible WebElements in document order
+        """
+        by, query = locator
+        kind = 'xpath' if by == By.XPATH else 'css'
+        return self.driver.execute_script(_VISIBLE_ELEMENTS_JS, kind, query, require_enabled) or []
+
+    def _find_clickable(self, locator: tuple, timeout: float):
+        """Wait for the first displayed and enabled element matching locator.
+        
+        Args:
+            locator: (By, selector) tuple, usually a combined CSS selector list
+            timeout: Total seconds to wait
+            
+        Returns:
+            The element, or None if none became clickable in time
+        """
+        def first_clickable(driver):
+            elements = self._visible_elements(locator, require_enabled=True)
+            return elements[0] if elements else False
+        
+        try:
+            return self._get_wait(timeout).until(first_clickable)
+        except TimeoutException:
+            return None
+
+    def _find_login_field(self, field_type: str, timeout: int = 5):
         """Dynamically find login input fields by analyzing the page."""
         try:
-            # Common selectors for email/username fields
+            # Common selectors for email/username and password fields
             if field_type == 'username':
-                selectors = [
-                    'input[type="email"]',
-                    'input[type="text"][name*="user"]',
-                    'input[type="text"][name*="email"]',
-                    'input[id*="user"]',
-                    'input[id*="email"]',
-                    'input[name="username"]',
-                    'input[name="email"]',
-                    'input[placeholder*="email"]',
-                    'input[placeholder*="username"]',
-                    'input[autocomplete="username"]',
-                    'input[autocomplete="email"]'
-                ]
-            # Common selectors for password fields
+                locator = _USERNAME_LOCATOR
             elif field_type == 'password':
-                selectors = [
-                    'input[type="password"]',
-                    'input[name="password"]',
-                    'input[id*="password"]',
-                    'input[id*="passwd"]',
-                    'input[autocomplete="current-password"]',
-                    'input[placeholder*="password"]'
-                ]
+                locator = _PASSWORD_LOCATOR
             else:
                 return None
             
-            for selector in selectors:
-                try:
-                    field = WebDriverWait(self.driver, timeout).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, selector))
-                    )
-                    self.logger.info(f"Found {field_type} field using selector: {selector}")
-                    return field
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            try:
+                field = self._get_wait(timeout).until(EC.presence_of_element_located(locator))
+                self.logger.info(f"Found {field_type} field by selector")
+                return field
+            except TimeoutException:
+                pass
             
             self.logger.error(f"Could not find {field_type} field with any known selector")
             return None
@@ -538,35 +1149,19 @@ class EcobeeAutomation:
     def _find_login_button(self):
         """Dynamically find the login/submit button."""
         try:
-            selectors = [
-                'button[type="submit"]',
-                'input[type="submit"]',
-                'button[id*="login"]',
-                'button[id*="submit"]',
-                'button[class*="login"]',
-                'button[class*="submit"]',
-                'a[id*="login"]',
-                'input[value*="Log"]',
-                'input[value*="Sign"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    button = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    self.logger.info(f"Found login button using selector: {selector}")
-                    return button
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            button = self._find_clickable(_LOGIN_BUTTON_LOCATOR, 5)
+            if button:
+                self.logger.info("Found login button by selector")
+                return button
             
             # If no button found by selectors, try finding by text content
             try:
                 buttons = self.driver.find_elements(By.TAG_NAME, 'button')
                 for button in buttons:
-                    text = button.text.lower()
-                    if 'log' in text or 'sign' in text or 'submit' in text:
-                        self.logger.info(f"Found login button by text: {button.text}")
+                    text = button.text
+                    lowered = text.lower()
+                    if 'log' in lowered or 'sign' in lowered or 'submit' in lowered:
+                        self.logger.info(f"Found login button by text: {text}")
                         return button
             except Exception:
                 pass
@@ -581,32 +1176,19 @@ class EcobeeAutomation:
     def _find_next_button(self):
         """Find 'Next' or 'Continue' button for multi-step login."""
         try:
-            selectors = [
-                'button[id*="next"]',
-                'button[id*="continue"]',
-                'button[class*="next"]',
-                'button[class*="continue"]',
-                'input[type="submit"]',
-                'button[type="submit"]'
-            ]
-            
-            for selector in selectors:
-                try:
-                    button = WebDriverWait(self.driver, 2).until(
-                        EC.element_to_be_clickable((By.CSS_SELECTOR, selector))
-                    )
-                    self.logger.info(f"Found next button using selector: {selector}")
-                    return button
-                except (TimeoutException, NoSuchElementException):
-                    continue
+            button = self._find_clickable(_NEXT_BUTTON_LOCATOR, 5)
+            if button:
+                self.logger.info("Found next button by selector")
+                return button
             
             # Try finding by text content
             try:
                 buttons = self.driver.find_elements(By.TAG_NAME, 'button')
                 for button in buttons:
-                    text = button.text.lower()
-                    if 'next' in text or 'continue' in text:
-                        self.logger.info(f"Found next button by text: {button.text}")
+                    text = button.text
+                    lowered = text.lower()
+                    if 'next' in lowered or 'continue' in lowered:
+                        self.logger.info(f"Found next button by text: {text}")
                         return button
             except Exception:
                 pass
@@ -629,119 +1211,179 @@ class EcobeeAutomation:
         """
         try:
             if not thermostat_name:
-                thermostat_name = self.config.get('ecobee.thermostat_name', 'Main Floor')
+                thermostat_name = self._thermostat_name
             
             self.logger.info(f"Selecting thermostat: {thermostat_name}")
             
-            # Wait for page to load
-            time.sleep(0.5)
+            # Clicking a thermostat navigates away from the device list
+            self._current_url = None
+            self._current_thermostat = None
+            self._system_panel_open = False
             
-            # Look for thermostat by text - try multiple approaches
-            # 1. Try finding links with the thermostat name
-            try:
-                thermostats = self.driver.find_elements(By.TAG_NAME, 'a')
-                for therm in thermostats:
-                    if thermostat_name.lower() in therm.text.lower():
-                        self.logger.info(f"Found thermostat link: {therm.text}")
-                        therm.click()
-                        time.sleep(2)
-                        return True
-            except Exception as e:
-                self.logger.debug(f"Could not find thermostat by link: {e}")
+            # Prefer links, then text, then device cards with the name
+            locators = _thermostat_locators(thermostat_name)
             
-            # 2. Try finding divs or spans with the name
-            try:
-                elements = self.driver.find_elements(By.XPATH, f"//*[contains(text(), '{thermostat_name}')]")
-                for elem in elements:
-                    if elem.is_displayed():
-                        self.logger.info(f"Found thermostat element: {elem.text}")
-                        # Try to click the element or its parent
-                        try:
-                            elem.click()
-                        except:
-                            elem.find_element(By.XPATH, './..').click()
-                        time.sleep(2)
-                        return True
-            except Exception as e:
-                self.logger.debug(f"Could not find thermostat by XPath: {e}")
+            def first_visible(driver):
+                for locator in locators:
+                    elements = self._visible_elements(locator)
+                    if elements:
+                        return elements
+                return False
             
-            # 3. Try finding by device card or tile
             try:
-                cards = self.driver.find_elements(By.CSS_SELECTOR, '[class*="device"], [class*="thermostat"], [class*="card"]')
-                for card in cards:
-                    if thermostat_name.lower() in card.text.lower():
-                        self.logger.info(f"Found thermostat card")
-                        card.click()
-                        time.sleep(2)
-                        return True
-            except Exception as e:
-                self.logger.debug(f"Could not find thermostat by card: {e}")
+                elements = self._get_wait(5).until(first_visible)
+            except TimeoutException:
+                self.logger.error(f"Could not find thermostat: {thermostat_name}")
+                self._log_page_structure()
+                return False
             
-            self.logger.error(f"Could not find thermostat: {thermostat_name}")
-            self._log_page_structure()
-            return False
+            thermostat = elements[0]
+            # Reading the text costs a round trip, so only do it when it will be logged
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Found thermostat element: {thermostat.text}")
+            try:
+                thermostat.click()
+            except WebDriverException:
+                # Covered or not interactable; dispatch the click in the page instead
+                self.driver.execute_script("arguments[0].click();", thermostat)
+            
+            # Wait for the device list to be replaced by the thermostat view
+            self._wait_until(EC.staleness_of(thermostat))
+            self._current_thermostat = thermostat_name
+            self._thermostat_opened_at = time.monotonic()
+            return True
             
         except Exception as e:
             self.logger.error(f"Error selecting thermostat: {e}")
             return False
 
-    def get_heating_status(self) -> HeatingStatus:
-        """Get current heating system status by clicking System tile."""
-        try:
-            self.logger.info("Retrieving heating system status")
+    def _open_thermostat(self, thermostat_name: str = None, system_panel: bool = False) -> bool:
+        """Show a thermostat's page, reusing it if it is already open.
+        
+        Navigating to the device list and selecting the thermostat is skipped
+        when the same thermostat was opened less than automation.nav_cache_ttl
+        seconds ago and nothing has navigated away since. An open System panel
+        only counts when the caller is about to use the panel anyway.
+        
+        Args:
+            thermostat_name: Name of the thermostat (uses config default if None)
+            system_panel: The caller opens the System panel next
             
-            # Navigate to devices page if not already there
-            devices_url = "https://www.ecobee.com/consumerportal/index.html#/devices"
-            if devices_url not in self.driver.current_url:
-                self.driver.get(devices_url)
-                time.sleep(self.config.get('automation.delay', 2))
+        Returns:
+            bool: True if the thermostat page is showing
+        """
+        thermostat_name = thermostat_name or self._thermostat_name
+        if (self._current_thermostat == thermostat_name
+                and (system_panel or not self._system_panel_open)
+                and time.monotonic() - self._thermostat_opened_at < self._nav_cache_ttl):
+            self.logger.info(f"Thermostat already open: {thermostat_name}")
+            return True
+        
+        self._goto(self.devices_url)
+        return self.select_thermostat(thermostat_name)
+
+    def get_heating_status(self, thermostat_name: str = None) -> HeatingStatus:
+        """Get current heating system status by clicking System tile.
+        
+        Args:
+            thermostat_name: Name of thermostat to read (uses config default if None)
+        """
+        driver = self.driver
+        logger = self.logger
+        try:
+            logger.info("Retrieving heating system status")
             
-            # Select the correct thermostat
-            if not self.select_thermostat():
+            # Open the thermostat unless it (or its System panel) is already showing
+            if not self._open_thermostat(thermostat_name, system_panel=True):
                 raise EcobeeAutomationError("Failed to select thermostat")
             
             # Click on System tile
-            self.logger.info("Looking for System tile...")
-            time.sleep(2)  # Wait for page to load
-            
             try:
-                # Try finding System tile by text
-                elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'System') or contains(text(), 'SYSTEM')]")
-                for elem in elements:
-                    if elem.is_displayed():
-                        self.logger.info(f"Found System element: {elem.text}")
-                        try:
-                            elem.click()
-                        except:
-                            # Try clicking parent
-                            elem.find_element(By.XPATH, './..').click()
-                        time.sleep(2)
-                        break
+                if not self._open_system_tile():
+                    logger.warning("System panel did not open; reading status from the current page")
             except Exception as e:
-                self.logger.warning(f"Could not find System tile: {e}")
+                logger.warning(f"Could not find System tile: {e}")
             
             status = HeatingStatus()
             
-            # Try to read current mode from the page
+            # Read temperatures and the mode indicator in a single round trip
             try:
-                # Look for active mode indicators (Aux or Heat)
-                page_text = self.driver.find_element(By.TAG_NAME, 'body').text.lower()
-                if 'aux' in page_text:
-                    status.mode = 'aux'
-                elif 'heat' in page_text:
-                    status.mode = 'heat'
-                self.logger.info(f"Detected mode from page: {status.mode}")
+                values = self._read_status_js()
+                status.current_temp = _parse_temp(values.get('current'))
+                status.target_temp = _parse_temp(values.get('target'))
+                status.mode = values.get('mode_attr')
             except Exception as e:
-                self.logger.warning(f"Could not detect mode: {e}")
+                logger.warning(f"Could not read status values: {e}")
             
-            self.logger.info(f"Retrieved status: {status}")
+            # Fall back to looking for active mode text on the page (Aux or Heat)
+            if not status.mode:
+                try:
+                    # Scan the page text in the browser so only the result crosses the wire
+                    status.mode = driver.execute_script(_PAGE_MODE_JS)
+                    logger.info(f"Detected mode from page: {status.mode}")
+                except Exception as e:
+                    logger.warning(f"Could not detect mode: {e}")
+            
+            logger.info(f"Retrieved status: {status}")
             return status
             
         except Exception as e:
-            self.logger.error(f"Failed to get heating status: {e}")
+            logger.error(f"Failed to get heating status: {e}")
+            # The page is in an unknown state; navigate afresh next time
+            self._current_thermostat = None
+            self._system_panel_open = False
             self._take_screenshot("status_error")
             raise EcobeeAutomationError(f"Status retrieval failed: {e}")
 
+    def _open_system_tile(self) -> bool:
+        """Click the selected thermostat's System tile and wait for its panel.
+        
+        Does nothing if the panel is already open for the thermostat that
+        _open_thermostat() just showed.
+        
+        Returns:
+            bool: True if the System panel is showing
+        """
+        if self._system_panel_open:
+            self.logger.info("System panel already open")
+            return True
+        
+        self.logger.info("Looking for System tile...")
+        # Matches are filtered for visibility in the browser, one call per poll
+        tile = self._find_clickable(_SYSTEM_TILE_LOCATOR, timeout=10)
+        if tile is None:
+            return False
+        
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"Found System element: {tile.text}")
+        try:
+            tile.click()
+        except WebDriverException:
+            # Something overlays the tile; dispatch the click from the page instead
+            self.driver.execute_script("arguments[0].click();", tile)
+        
+        # Wait for the System panel's mode options to appear
+        self._system_panel_open = self._wait_until(lambda d: self._visible_elements(_MODE_OPTION_LOCATOR))
+        return self._system_panel_open
+
+    def _read_status_js(self) -> Dict[str, Optional[str]]:
+        """Read current temperature, target temperature and mode from the page.
+        
+        Evaluated over the DevTools protocol, which skips the WebDriver
+        element-reference layer entirely. Repeated reads on the same page
+        return the snapshot kept up to date by the page's MutationObserver.
+        
+        Returns:
+            Dict with 'current', 'target', 'mode_attr' and 'mode_text' (None if missing)
+        """
+        response = self.driver.execute_cdp_cmd('Runtime.evaluate', {
+            'expression': self._status_expression,
+            'returnByValue': True,
+        })
+        if 'exceptionDetails' in response:
+            raise EcobeeAutomationError(f"Status script failed: {response['exceptionDetails'].get('text')}")
+        return response.get('result', {}).get('value') or {}
+
     def set_heating_mode(self, mode: str, thermostat_name: str = None) -> bool:
         """Set the heating system mode (aux or heat).
         
@@ -759,49 +1401,37 @@ class EcobeeAutomation:
             if mode not in ['aux', 'heat']:
                 raise ValueError(f"Invalid mode: {mode}. Must be either 'aux' or 'heat'")
             
-            # Navigate to devices page if not already there
-            devices_url = "https://www.ecobee.com/consumerportal/index.html#/devices"
-            if devices_url not in self.driver.current_url:
-                self.driver.get(devices_url)
-                time.sleep(self.config.get('automation.delay', 2))
-            
-            # Select the correct thermostat
-            if not self.select_thermostat(thermostat_name):
+            # Open the thermostat unless it (or its System panel) is already showing
+            if not self._open_thermostat(thermostat_name, system_panel=True):
                 raise EcobeeAutomationError("Failed to select thermostat")
             
             # Click on System tile
-            self.logger.info("Looking for System tile...")
-            time.sleep(2)
-            
             try:
-                elements = self.driver.find_elements(By.XPATH, "//*[contains(text(), 'System') or contains(text(), 'SYSTEM')]")
-                for elem in elements:
-                    if elem.is_displayed():
-                        self.logger.info(f"Found System element, clicking...")
-                        try:
-                            elem.click()
-                        except:
-                            elem.find_element(By.XPATH, './..').click()
-                        time.sleep(2)
-                        break
+                if not self._open_system_tile():
+                    self.logger.error("System panel did not open")
+                    return False
             except Exception as e:
                 self.logger.error(f"Could not find System tile: {e}")
                 return False
             
+            # Count the page's requests from here on so the save can be awaited
+            self.driver.execute_script(_TRACK_REQUESTS_JS)
+            
             # Look for radio buttons with labels
             self.logger.info(f"Looking for {mode.upper()} radio button...")
             try:
                 # Find all labels that might contain the mode text
                 labels = self.driver.find_elements(By.TAG_NAME, 'label')
                 for label in labels:
-                    label_text = label.text.strip().lower()
+                    text = label.text
+                    label_text = text.strip().lower()
                     # Check if this label is for the mode we want
-                    if mode.lower() in label_text or (mode.lower() == 'aux' and 'auxil' in label_text):
-                        self.logger.info(f"Found label with text: '{label.text}', clicking...")
+                    if mode in label_text or (mode == 'aux' and 'auxil' in label_text):
+                        self.logger.info(f"Found label with text: '{text}', clicking...")
                         try:
                             # Try clicking the label itself
                             label.click()
-                            time.sleep(5)
+                            self._wait_mode_selected(label)
                             self.logger.info(f"Successfully set mode to: {mode}")
                             return True
                         except Exception as e:
@@ -812,139 +1442,396 @@ class EcobeeAutomation:
                                 if label_for:
                                     radio_btn = self.driver.find_element(By.ID, label_for)
                                     radio_btn.click()
-                                    time.sleep(5)
+                                    self._wait_until(EC.element_to_be_selected(radio_btn), timeout=5)
+                                    self._wait_mode_saved()
                                     self.logger.info(f"Successfully set mode to: {mode}")
                                     return True
                             except Exception as e2:
                                 self.logger.warning(f"Failed to click radio button: {e2}")
                 
-                # Alternative: Try finding by text near radio buttons
-                mode_elements = self.driver.find_elements(By.XPATH, f"//*[contains(translate(text(), 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz'), '{mode.lower()}')]")
-                for elem in mode_elements:
-                    if elem.is_displayed():
-                        self.logger.info(f"Found {mode} element by XPath, clicking...")
-                        try:
-                            elem.click()
-                            time.sleep(5)
-                            self.logger.info(f"Successfully set mode to: {mode}")
-                            return True
-                        except:
-                            pass
+                # Alternative: match the radio button itself by value or aria-label
+                radio_btn = self.driver.execute_script(_MODE_RADIO_JS, mode)
+                if radio_btn:
+                    self.logger.info(f"Found {mode} radio button by value, clicking...")
+                    try:
+                        radio_btn.click()
+                        self._wait_until(EC.element_to_be_selected(radio_btn), timeout=5)
+                        self._wait_mode_saved()
+                        self.logger.info(f"Successfully set mode to: {mode}")
+                        return True
+                    except Exception as e:
+                        self.logger.warning(f"Failed to click radio button: {e}")
                         
             except Exception as e:
                 self.logger.error(f"Error clicking mode element: {e}")
             
             self.logger.error(f"Could not find {mode} option")
+            self._current_thermostat = None
+            self._system_panel_open = False
             self._log_page_structure()
             return False
             
         except Exception as e:
             self.logger.error(f"Failed to set heating mode: {e}")
+            self._current_thermostat = None
+            self._system_panel_open = False
             self._take_screenshot("mode_change_error")
             return False
 
-    def set_main_floor_aux(self) -> bool:
-        """Set Main Floor thermostat heating mode to Aux.
+    def _wait_mode_selected(self, label) -> None:
+        """Wait for the radio button behind a clicked mode label to become selected.
         
-        Returns:
-            bool: True if mode was set successfully
+        Then waits for the page to settle (see _wait_mode_saved).
         """
-        return self.set_heating_mode('aux', 'Main Floor')
-
-    def set_main_floor_heat(self) -> bool:
-        """Set Main Floor thermostat heating mode to Heat.
+        label_for = label.get_attribute('for')
+        if label_for:
+            radios = self.driver.find_elements(By.ID, label_for)
+        else:
+            radios = label.find_elements(By.TAG_NAME, 'input')
         
-        Returns:
-            bool: True if mode was set successfully
-        """
-        return self.set_heating_mode('heat', 'Main Floor')
+        if radios:
+            self._wait_until(EC.element_to_be_selected(radios[0]), timeout=5)
+        self._wait_mode_saved()
 
-    def set_upstairs_aux(self) -> bool:
-        """Set Upstairs thermostat heating mode to Aux.
+    def _wait_mode_saved(self) -> None:
+        """Wait for the portal to finish saving a mode change.
         
-        Returns:
-            bool: True if mode was set successfully
+        The radio button is selected as soon as it is clicked, but the portal
+        saves the change with a request afterwards. Returning before that
+        finishes lets callers quit Chrome and abort the save, so wait (at
+        most 5 seconds, the old fixed pause) until none of the requests
+        tracked since set_heating_mode() installed _TRACK_REQUESTS_JS has been
+        in flight for half a second. That quiet period is also the minimum
+        wait, giving the save request time to start.
         """
-        return self.set_heating_mode('aux', 'Upstairs')
+        # Restart the idle clock so the quiet period counts from the click
+        self.driver.execute_script(_TRACK_REQUESTS_JS)
+        if not self._wait_ready(timeout=5):
+            self.logger.warning("Page did not settle after changing the mode")
 
-    def set_upstairs_heat(self) -> bool:
-        """Set Upstairs thermostat heating mode to Heat.
+    def set_preset(self, name: str) -> bool:
+        """Set the heating mode of one thermostat by preset name.
         
+        Args:
+            name: Key of PRESETS (e.g., 'main_floor_aux')
+            
         Returns:
             bool: True if mode was set successfully
         """
-        return self.set_heating_mode('heat', 'Upstairs')
+        thermostat_name, mode = PRESETS[name]
+        return self.set_heating_mode(mode, thermostat_name)
 
     def set_temperature(self, temperature: float) -> bool:
         """Set the target temperature."""
+        driver = self.driver
+        logger = self.logger
         try:
-            self.logger.info(f"Setting target temperature to: {temperature}°F")
+            logger.info(f"Setting target temperature to: {temperature}°F")
             
-            current_status = self.get_heating_status()
-            if not current_status.target_temp:
+            current_target = self._get_target_temp()
+            if current_target is None:
                 raise EcobeeAutomationError("Could not retrieve current target temperature")
             
-            temp_diff = temperature - current_status.target_temp
+            temp_diff = temperature - current_target
             
             if abs(temp_diff) < 0.5:  # Already at target temperature
-                self.logger.info("Temperature already at target")
+                logger.info("Temperature already at target")
                 return True
             
             # Click temp up or down buttons to reach target
-            button_selector = self.selectors['temp_up'] if temp_diff > 0 else self.selectors['temp_down']
+            button_locator = self._locators['temp_up'] if temp_diff > 0 else self._locators['temp_down']
             clicks_needed = abs(int(temp_diff))
             
             temp_button = self.wait.until(
-                EC.element_to_be_clickable((By.CSS_SELECTOR, button_selector))
+                EC.element_to_be_clickable(button_locator)
             )
+            target_locator = self._locators['target_temp']
+            expected_temp = current_target + (clicks_needed if temp_diff > 0 else -clicks_needed)
+            
+            # Click the button clicks_needed times in one round trip, then wait
+            # once for the displayed target to reach the expected value
+            driver.execute_script(
+                "for (let i = 0; i < arguments[1]; i++) { arguments[0].click(); }",
+                temp_button, clicks_needed
+            )
+            reached = lambda d: _parse_temp(d.find_element(*target_locator).text) == expected_temp
+            if not self._wait_until(reached):
+                # The page dropped (or is still applying) some synthetic clicks.
+                # Once the display stops changing, correct the difference with
+                # trusted input in whichever direction it is off.
+                shown = self._read_settled_temp(target_locator)
+                if shown is None:
+                    raise EcobeeAutomationError("Could not read target temperature after clicking")
+                remaining = int(expected_temp - shown)
+                if remaining:
+                    direction = 'temp_up' if remaining > 0 else 'temp_down'
+                    logger.info(f"Sending {abs(remaining)} {direction} clicks as input events")
+                    correction_button = self.wait.until(
+                        EC.element_to_be_clickable(self._locators[direction])
+                    )
+                    self._dispatch_clicks(correction_button, abs(remaining))
+                if not self._wait_until(reached):
+                    raise EcobeeAutomationError(f"Target temperature did not reach {expected_temp}°F")
             
-            for _ in range(clicks_needed):
-                temp_button.click()
-                time.sleep(0.5)  # Small delay between clicks
-            
-            # Save changes
-            try:
-                save_button = self.driver.find_element(By.CSS_SELECTOR, self.selectors['save_button'])
+            # Save changes once the page has enabled the save button
+            save_locator = self._locators['save_button']
+            if driver.find_elements(*save_locator):
+                try:
+                    save_button = self._get_wait(self._delay).until(EC.element_to_be_clickable(save_locator))
+                except TimeoutException:
+                    raise EcobeeAutomationError("Save button did not become clickable")
                 save_button.click()
-                time.sleep(self.config.get('automation.delay', 2))
-            except NoSuchElementException:
-                pass
+                self._wait_until(EC.staleness_of(save_button))
             
-            self.logger.info(f"Successfully set temperature to: {temperature}°F")
+            logger.info(f"Successfully set temperature to: {temperature}°F")
             return True
             
         except Exception as e:
-            self.logger.error(f"Failed to set temperature: {e}")
+            logger.error(f"Failed to set temperature: {e}")
             self._take_screenshot("temp_change_error")
             return False
 
+    def _read_settled_temp(self, locator: tuple) -> Optional[float]:
+        """Read a displayed temperature once it has stopped changing.
+        
+        Polls every 250ms until two consecutive reads agree, for at most
+        automation.delay seconds.
+        
+        Args:
+            locator: (By, selector) tuple of the temperature element
+            
+        Returns:
+            The settled temperature, or None if it never settled or parsed
+        """
+        last = [None]
+        
+        def settled(driver):
+            temp = _parse_temp(driver.find_element(*locator).text)
+            previous, last[0] = last[0], temp
+            # Wrapped so a reading of 0.0 still counts
+            return (temp,) if temp is not None and temp == previous else False
+        
+        try:
+            return WebDriverWait(self.driver, self._delay, poll_frequency=0.25).until(settled)[0]
+        except TimeoutException:
+            return None
+
+    def _dispatch_clicks(self, element, count: int) -> None:
+        """Click an element count times with trusted CDP mouse events.
+        
+        All press/release pairs are sent back to back without sleeping;
+        the caller waits once for the page to reflect them.
+        
+        Args:
+            element: WebElement to click
+            count: Number of clicks
+        """
+        x, y = self.driver.execute_script(
+            "arguments[0].scrollIntoView({block: 'center'});"
+            "const r = arguments[0].getBoundingClientRect();"
+            "return [r.left + r.width / 2, r.top + r.height / 2];",
+            element
+        )
+        event = {'x': x, 'y': y, 'button': 'left', 'clickCount': 1}
+        for _ in range(count):
+            self.driver.execute_cdp_cmd('Input.dispatchMouseEvent', {**event, 'type': 'mousePressed'})
+            self.driver.execute_cdp_cmd('Input.dispatchMouseEvent', {**event, 'type': 'mouseReleased'})
+
+    def _get_target_temp(self) -> Optional[float]:
+        """Read only the target temperature of the configured thermostat.
+        
+        Cheaper than get_heating_status() when the mode and current
+        temperature are not needed.
+        
+        Returns:
+            Target temperature, or None if it could not be read
+        """
+        if not self._open_thermostat():
+            raise EcobeeAutomationError("Failed to select thermostat")
+        
+        # Poll the element text directly until it holds a temperature, so a
+        # placeholder rendered before the value arrives is not mistaken for it
+        def parsed_temp(driver):
+            temp = _parse_temp(driver.execute_script(
+                "const el = document.querySelector(arguments[0]); return el && el.textContent;",
+                self.selectors['target_temp']
+            ))
+            # Wrapped so a reading of 0.0 still counts as parsed
+            return (temp,) if temp is not None else False
+        
+        try:
+            return self._get_wait(self._delay).until(parsed_temp)[0]
+        except TimeoutException:
+            return None
+
+    def _goto(self, url: str, force: bool = False) -> None:
+        """Navigate to a URL unless the browser is already known to be on it.
+        
+        Uses the locally tracked self._current_url instead of querying
+        driver.current_url, which costs a WebDriver round trip.
+        
+        Args:
+            url: URL to load
+            force: Load the URL even if it is the current page
+        """
+        if force or self._current_url != url:
+            self.driver.get(url)
+            self._current_url = url
+            self._current_thermostat = None
+            self._system_panel_open = False
+
+    def _wait_ready(self, timeout: Optional[float] = None, quiet: float = 0.5) -> bool:
+        """Poll every 100ms until the page has loaded and has no requests pending.
+        
+        Requests are only counted after _TRACK_REQUESTS_JS has been run on
+        the page; until then only jQuery's own counter is checked.
+        
+        Args:
+            timeout: Seconds to wait (defaults to the explicit wait)
+            quiet: Seconds that tracked requests must have been idle
+            
+        Returns:
+            bool: True if the page became ready before the timeout
+        """
+        try:
+            WebDriverWait(self.driver, timeout or self._explicit_wait, poll_frequency=0.1).until(
+                lambda d: d.execute_script(_PAGE_READY_JS, int(quiet * 1000))
+            )
+            return True
+        except TimeoutException:
+            return False
+
+    def _get_wait(self, timeout: float) -> WebDriverWait:
+        """Return a WebDriverWait for the current driver, reusing one per timeout."""
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = WebDriverWait(self.driver, timeout)
+        return wait
+
+    def _wait_until(self, condition, timeout: Optional[float] = None) -> bool:
+        """Wait for an expected condition instead of sleeping a fixed time.
+        
+        Returns as soon as the condition holds. The timeout defaults to
+        automation.delay, so it never waits longer than the old fixed sleep.
+        
+        Args:
+            condition: Expected condition or callable taking the driver
+            timeout: Maximum seconds to wait
+            
+        Returns:
+            bool: True if the condition was met, False on timeout
+        """
+        if timeout is None:
+            timeout = self._delay
+        try:
+            self._get_wait(timeout).until(condition)
+            return True
+        except TimeoutException:
+            return False
+
     def _take_screenshot(self, name: str) -> None:
         """Take a screenshot for debugging purposes."""
-        if not self.config.get('automation.screenshot_on_error', True) or not self.driver:
+        if not self._screenshot_enabled or not self.driver:
             return
         
         try:
-            screenshots_dir = os.path.join(os.path.dirname(__file__), '..', 'screenshots')
-            os.makedirs(screenshots_dir, exist_ok=True)
-            
             timestamp = int(time.time())
             filename = f"{name}_{timestamp}.png"
-            filepath = os.path.join(screenshots_dir, filename)
-            
-            self.driver.save_screenshot(filepath)
-            self.logger.info(f"Screenshot saved: {filepath}")
+            filepath = os.path.join(_SCREENSHOTS_DIR, filename)
+            
+            # Capture on this thread (the driver is not shared between threads)
+            # and leave only the file write to the screenshot thread
+            png = self.driver.get_screenshot_as_png()
+            self._screenshot_futures = [f for f in self._screenshot_futures if not f.done()]
+            self._screenshot_futures.append(
+                self._screenshot_executor.submit(self._save_screenshot, png, filepath)
+            )
             
         except Exception as e:
             self.logger.warning(f"Failed to take screenshot: {e}")
 
+    def _save_screenshot(self, png: bytes, filepath: str) -> None:
+        """Write captured screenshot bytes on the screenshot thread."""
+        try:
+            with open(filepath, 'wb') as f:
+                f.write(png)
+            self.logger.info(f"Screenshot saved: {filepath}")
+        except OSError as e:
+            self.logger.warning(f"Failed to save screenshot: {e}")
+
     def close(self) -> None:
-        """Clean up and close the browser."""
-        if self.driver:
-            try:
-                self.driver.quit()
-                self.logger.info("Browser closed successfully")
-            except Exception as e:
-                self.logger.warning(f"Error closing browser: {e}")
+        """Clean up and close the browser.
+        
+        driver.quit() can hang when chromedriver is wedged, so it runs on a
+        helper thread and the process group is killed if it takes over 5s.
+        A driver that has already exited is only cleaned up, not quit.
+        """
+        if not self.driver:
+            return
+        
+        if not self._driver_alive():
+            self.logger.warning("Browser is no longer running, skipping quit")
+            self.kill()
+            return
+        
+        # Let pending screenshots finish before the browser goes away
+        if self._screenshot_futures:
+            wait_futures(self._screenshot_futures, timeout=5)
+            self._screenshot_futures = []
+        
+        quit_thread = threading.Thread(target=self._quit_driver, args=(self.driver,),
+                                       name='ecobee-quit', daemon=True)
+        quit_thread.start()
+        quit_thread.join(5)
+        if quit_thread.is_alive():
+            self.logger.warning("Browser did not quit within 5s, killing it")
+            self.kill()
+            return
+        
+        self.driver = None
+        self.wait = None
+        self._current_url = None
+        self._current_thermostat = None
+        self._system_panel_open = False
+
+    def _quit_driver(self, driver: webdriver.Chrome) -> None:
+        """Quit the WebDriver session on the quit helper thread."""
+        try:
+            driver.quit()
+            self.logger.info("Browser closed successfully")
+        except Exception as e:
+            self.logger.warning(f"Error closing browser: {e}")
+
+    def kill(self) -> None:
+        """Forcefully stop chromedriver and the browser processes it started.
+        
+        Used when a command hangs. The whole process group is terminated so
+        Chrome is not orphaned, and the driver is dropped so the next call to
+        ensure_logged_in() starts a fresh session.
+        """
+        process = self.driver.service.process if self.driver else None
+        self.driver = None
+        self.wait = None
+        self._logged_in_at = None
+        self._current_url = None
+        self._current_thermostat = None
+        self._system_panel_open = False
+        
+        if process is None or process.poll() is not None:
+            return
+        
+        self.logger.warning(f"Killing chromedriver process group {process.pid}")
+        try:
+            if hasattr(os, 'killpg'):
+                os.killpg(process.pid, signal.SIGTERM)
+                try:
+                    process.wait(timeout=1)
+                except subprocess.TimeoutExpired:
+                    os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except OSError as e:
+            self.logger.warning(f"Error killing chromedriver: {e}")
 
     def __enter__(self):
         """Context manager entry."""
@@ -975,10 +1862,7 @@ def main():
         config_manager = ConfigManager()
         
         # Validate required configuration
-        required_config = ['ecobee.username', 'ecobee.password']
-        for key in required_config:
-            if not config_manager.get(key):
-                raise ValueError(f"Missing required configuration: {key}")
+        config_manager.validate_required(['ecobee.username', 'ecobee.password'])
         
         # Run automation
         with EcobeeAutomation(config_manager) as automation:
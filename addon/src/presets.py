@@ -0,0 +1,14 @@
+"""
+Heating mode presets for Ecobee Automation
+
+Kept free of Selenium imports so the CLI can build its commands from them
+without loading the automation module.
+"""
+
+# Preset name -> (thermostat name, heating mode)
+PRESETS = {
+    'main_floor_aux': ('Main Floor', 'aux'),
+    'main_floor_heat': ('Main Floor', 'heat'),
+    'upstairs_aux': ('Upstairs', 'aux'),
+    'upstairs_heat': ('Upstairs', 'heat'),
+}
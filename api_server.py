@@ -7,69 +7,201 @@ Provides REST endpoints for Home Assistant integration.
 
 from flask import Flask, jsonify
 import logging
-import sys
 import os
 import threading
-import subprocess
+import time
+import atexit
+import queue
+from dataclasses import asdict
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from src.config_manager import ConfigManager
+from src.ecobee_automation import EcobeeAutomation
+from cli import run_command
 
 app = Flask(__name__)
 
-# Configure logging
+# Configure logging (thread/process details are not in the format, so skip collecting them)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
 logging.basicConfig(
     level=os.getenv('LOG_LEVEL', 'INFO'),
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
-# Lock for sequential execution (only one automation at a time)
-automation_lock = threading.Lock()
+# Configuration is loaded once; the automation session is created on first use and kept warm
+config = ConfigManager()
+automation = None
 
-# Path to CLI script
-CLI_PATH = os.path.join(os.path.dirname(__file__), 'cli.py')
+# Commands are queued and run one at a time by a single worker thread
+QUEUE_SIZE = config.get('api.queue_size', 5)
+COMMAND_TIMEOUT = config.get('api.command_timeout', 120)
+RETRY_AFTER = 30
+command_queue = queue.Queue(maxsize=QUEUE_SIZE)
 
+# Mode commands are idempotent: recent results are reused for a short time and
+# duplicates of a running command wait for it instead of queueing another run.
+# command -> {'done': Event, 'result': response tuple, 'finished_at': monotonic time}
+COMMAND_CACHE_TTL = config.get('api.command_cache_ttl', 10)
+command_cache = {}
+command_cache_lock = threading.Lock()
 
-def run_cli_command(command):
-    """Run a CLI command and return the result."""
-    if not automation_lock.acquire(blocking=False):
-        return {'success': False, 'error': 'Another automation is already running'}, 409
+
+def get_automation():
+    """Return the shared automation instance, creating it on first use.
     
+    Must only be called from the automation worker thread.
+    """
+    global automation
+    if automation is None:
+        automation = EcobeeAutomation(config)
+        atexit.register(automation.close)
+    return automation
+
+
+def automation_worker():
+    """Run queued jobs in FIFO order against the shared automation session."""
+    while True:
+        job, future = command_queue.get()
+        try:
+            if future.set_running_or_notify_cancel():
+                try:
+                    future.set_result(job())
+                except Exception as e:
+                    future.set_exception(e)
+        finally:
+            command_queue.task_done()
+
+
+threading.Thread(target=automation_worker, name='automation-worker', daemon=True).start()
+
+
+def warm_start():
+    """Start the browser and log in ahead of the first request."""
     try:
-        logger.info(f"Executing command: {command}")
-        logger.info(f"CLI path: {CLI_PATH}")
-        logger.info(f"Working directory: {os.path.dirname(__file__)}")
-        
-        # Run with combined stderr and stdout
-        result = subprocess.run(
-            ['python3', CLI_PATH, command],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            timeout=120,
-            cwd=os.path.dirname(__file__)
-        )
-        
-        # Log the full output
-        logger.info(f"Command return code: {result.returncode}")
-        logger.info(f"Command output:\n{result.stdout}")
-        
-        if result.returncode == 0:
-            logger.info(f"Command succeeded: {command}")
-            return {'success': True, 'output': result.stdout}, 200
+        if get_automation().ensure_logged_in():
+            logger.info("Warm start complete, session is logged in")
         else:
-            logger.error(f"Command failed with return code {result.returncode}")
-            return {'success': False, 'error': result.stdout, 'return_code': result.returncode}, 500
-            
-    except subprocess.TimeoutExpired:
-        logger.error(f"Command timed out: {command}")
-        return {'success': False, 'error': 'Command timed out'}, 500
+            logger.warning("Warm start login failed; will retry on first request")
     except Exception as e:
-        logger.error(f"Error running command: {e}", exc_info=True)
-        return {'success': False, 'error': str(e)}, 500
-    finally:
-        automation_lock.release()
+        logger.warning("Warm start failed: %s", e)
+    return None, None
+
+
+has_credentials = (config.has_required(['ecobee.username', 'ecobee.password'])
+                   or config.get('ecobee.onepassword_item'))
+if config.get('api.warm_start', True) and has_credentials:
+    command_queue.put_nowait((warm_start, Future()))
+
+
+def submit_job(job):
+    """Queue a job for the automation worker and wait for its result.
+    
+    Returns:
+        Tuple of (response dict, HTTP status, response headers)
+    """
+    future = Future()
+    try:
+        command_queue.put_nowait((job, future))
+    except queue.Full:
+        logger.warning("Command queue is full, rejecting request")
+        return ({'success': False, 'error': 'Too many queued requests'}, 429,
+                {'Retry-After': str(RETRY_AFTER)})
+    
+    try:
+        result, status = future.result(timeout=COMMAND_TIMEOUT)
+        return result, status, {}
+    except FutureTimeoutError:
+        logger.error("Command timed out")
+        if not future.cancel() and not future.done() and automation is not None:
+            # Already running: kill the browser so the worker is freed and Chrome is not orphaned
+            automation.kill()
+        return {'success': False, 'error': 'Command timed out'}, 504, {}
+    except Exception as e:
+        logger.error("Error running command: %s", e, exc_info=True)
+        return {'success': False, 'error': str(e)}, 500, {}
+
+
+def execute_command(command):
+    """Run a CLI command in-process against the shared automation session."""
+    logger.info("Executing command: %s", command)
+    
+    # Reuse the logged-in browser session, logging in only when needed
+    session = get_automation()
+    if not session.ensure_logged_in():
+        logger.error("Failed to login to ecobee")
+        return {'success': False, 'error': 'Failed to login to ecobee'}, 500
+    
+    success, output = run_command(session, command)
+    logger.info("Command output: %s", output)
+    
+    if success:
+        logger.info("Command succeeded: %s", command)
+        return {'success': True, 'output': output}, 200
+    else:
+        logger.error("Command failed: %s", command)
+        return {'success': False, 'error': output}, 500
+
+
+def refresh_session():
+    """Force a fresh login on the shared browser session."""
+    if get_automation().ensure_logged_in(force=True):
+        return {'success': True}, 200
+    return {'success': False, 'error': 'Failed to login to ecobee'}, 500
+
+
+def read_status(thermostat_name):
+    """Read a thermostat's status from the shared browser session."""
+    session = get_automation()
+    if not session.ensure_logged_in():
+        return {'success': False, 'error': 'Failed to login to ecobee'}, 500
+    
+    status = session.get_heating_status(thermostat_name)
+    return {'success': True, 'status': asdict(status)}, 200
+
+
+def run_cli_command(command):
+    """Queue a CLI command and wait for its result.
+    
+    A repeat of a command within api.command_cache_ttl seconds returns the
+    previous result, and a repeat while it is still running shares its result,
+    as long as no other command has been submitted in between.
+    """
+    with command_cache_lock:
+        entry = command_cache.get(command)
+        reuse = entry is not None and (
+            not entry['done'].is_set()
+            or time.monotonic() - entry['finished_at'] < COMMAND_CACHE_TTL
+        )
+        if not reuse:
+            # This run changes what any earlier command did, so none of their
+            # results may be handed out from now on (waiters keep their entry)
+            command_cache.clear()
+            entry = {'done': threading.Event(), 'result': None, 'finished_at': None}
+            command_cache[command] = entry
+    
+    if reuse:
+        logger.info("Reusing result of in-flight or recent command: %s", command)
+        entry['done'].wait()
+        return entry['result']
+    
+    try:
+        result = submit_job(lambda: execute_command(command))
+    except Exception as e:
+        result = {'success': False, 'error': str(e)}, 500, {}
+    
+    with command_cache_lock:
+        entry['result'] = result
+        entry['finished_at'] = time.monotonic()
+        
+        # Failures are not cached
+        if result[1] != 200 and command_cache.get(command) is entry:
+            del command_cache[command]
+    
+    entry['done'].set()
+    return result
 
 
 @app.route('/health', methods=['GET'])
@@ -78,45 +210,70 @@ def health():
     return jsonify({'status': 'ok'}), 200
 
 
+@app.route('/ecobee/session/refresh', methods=['POST'])
+def session_refresh():
+    """Force a fresh login on the shared browser session."""
+    result, status, headers = submit_job(refresh_session)
+    return jsonify(result), status, headers
+
+
+@app.route('/ecobee/main-floor/status', methods=['GET'])
+def main_floor_status():
+    """Get Main Floor thermostat status."""
+    result, status, headers = submit_job(lambda: read_status('Main Floor'))
+    return jsonify(result), status, headers
+
+
+@app.route('/ecobee/upstairs/status', methods=['GET'])
+def upstairs_status():
+    """Get Upstairs thermostat status."""
+    result, status, headers = submit_job(lambda: read_status('Upstairs'))
+    return jsonify(result), status, headers
+
+
 @app.route('/ecobee/main-floor/aux', methods=['POST'])
 def main_floor_aux():
     """Set Main Floor thermostat to Aux mode."""
-    result, status = run_cli_command('main-floor-aux')
-    return jsonify(result), status
+    result, status, headers = run_cli_command('main-floor-aux')
+    return jsonify(result), status, headers
 
 
 @app.route('/ecobee/main-floor/heat', methods=['POST'])
 def main_floor_heat():
     """Set Main Floor thermostat to Heat mode."""
-    result, status = run_cli_command('main-floor-heat')
-    return jsonify(result), status
+    result, status, headers = run_cli_command('main-floor-heat')
+    return jsonify(result), status, headers
 
 
 @app.route('/ecobee/upstairs/aux', methods=['POST'])
 def upstairs_aux():
     """Set Upstairs thermostat to Aux mode."""
-    result, status = run_cli_command('upstairs-aux')
-    return jsonify(result), status
+    result, status, headers = run_cli_command('upstairs-aux')
+    return jsonify(result), status, headers
 
 
 @app.route('/ecobee/upstairs/heat', methods=['POST'])
 def upstairs_heat():
     """Set Upstairs thermostat to Heat mode."""
-    result, status = run_cli_command('upstairs-heat')
-    return jsonify(result), status
+    result, status, headers = run_cli_command('upstairs-heat')
+    return jsonify(result), status, headers
 
 
 if __name__ == '__main__':
+    # Development server only; the add-on runs under gunicorn (see gunicorn_conf.py)
     # Get port from environment or use default
     port = int(os.environ.get('API_PORT', 5000))
     host = '0.0.0.0'
     
-    logger.info(f"Starting Ecobee API server on {host}:{port}")
+    logger.info("Starting Ecobee API server on %s:%s", host, port)
     logger.info("Available endpoints:")
     logger.info("  POST /ecobee/main-floor/aux   - Set Main Floor to Aux")
     logger.info("  POST /ecobee/main-floor/heat  - Set Main Floor to Heat")
     logger.info("  POST /ecobee/upstairs/aux     - Set Upstairs to Aux")
     logger.info("  POST /ecobee/upstairs/heat    - Set Upstairs to Heat")
+    logger.info("  GET  /ecobee/main-floor/status - Get Main Floor status")
+    logger.info("  GET  /ecobee/upstairs/status  - Get Upstairs status")
+    logger.info("  POST /ecobee/session/refresh  - Force a fresh ecobee login")
     logger.info("  GET  /health                  - Health check")
     
     app.run(host=host, port=port, debug=False)
@@ -8,18 +8,21 @@ Provides a simple CLI for common ecobee automation tasks.
 import argparse
 import logging
 import sys
-import os
-
-# Add src directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
+from typing import Tuple, TYPE_CHECKING
 
 from src.config_manager import ConfigManager
-from src.ecobee_automation import EcobeeAutomation
-from src.exceptions import EcobeeAutomationError
+from src.presets import PRESETS
+
+if TYPE_CHECKING:
+    from src.ecobee_automation import EcobeeAutomation
 
 
 def setup_logging(log_level: str = 'INFO'):
     """Set up logging configuration."""
+    # Thread/process details are not in the format, so skip collecting them
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
     logging.basicConfig(
         level=getattr(logging, log_level.upper()),
         format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
@@ -29,82 +32,31 @@ def setup_logging(log_level: str = 'INFO'):
     )
 
 
-def cmd_main_floor_aux(args, automation: EcobeeAutomation) -> int:
-    """Set Main Floor thermostat heating mode to Aux."""
-    try:
-        if automation.set_main_floor_aux():
-            print(f"Successfully set Main Floor to: aux")
-            return 0
-        else:
-            print(f"Failed to set Main Floor to: aux")
-            return 1
-    except Exception as e:
-        print(f"Error setting mode: {e}")
-        return 1
-
-
-def cmd_main_floor_heat(args, automation: EcobeeAutomation) -> int:
-    """Set Main Floor thermostat heating mode to Heat."""
-    try:
-        if automation.set_main_floor_heat():
-            print(f"Successfully set Main Floor to: heat")
-            return 0
-        else:
-            print(f"Failed to set Main Floor to: heat")
-            return 1
-    except Exception as e:
-        print(f"Error setting mode: {e}")
-        return 1
-
-
-def cmd_upstairs_aux(args, automation: EcobeeAutomation) -> int:
-    """Set Upstairs thermostat heating mode to Aux."""
-    try:
-        if automation.set_upstairs_aux():
-            print(f"Successfully set Upstairs to: aux")
-            return 0
-        else:
-            print(f"Failed to set Upstairs to: aux")
-            return 1
-    except Exception as e:
-        print(f"Error setting mode: {e}")
-        return 1
+# Command name -> EcobeeAutomation preset name
+COMMANDS = {name.replace('_', '-'): name for name in PRESETS}
 
 
-def cmd_upstairs_heat(args, automation: EcobeeAutomation) -> int:
-    """Set Upstairs thermostat heating mode to Heat."""
-    try:
-        if automation.set_upstairs_heat():
-            print(f"Successfully set Upstairs to: heat")
-            return 0
-        else:
-            print(f"Failed to set Upstairs to: heat")
-            return 1
-    except Exception as e:
-        print(f"Error setting mode: {e}")
-        return 1
+def run_command(automation: 'EcobeeAutomation', command: str) -> Tuple[bool, str]:
+    """Run a command against a logged-in automation instance.
+    
+    Shared by the CLI and the REST API server so both go through the same dispatch.
+    
+    Args:
+        automation: Logged-in EcobeeAutomation instance
+        command: Command name (key of COMMANDS)
+        
+    Returns:
+        Tuple of (success, result message)
+    """
+    preset = COMMANDS[command]
+    label, mode = PRESETS[preset]
+    if automation.set_preset(preset):
+        return True, f"Successfully set {label} to: {mode}"
+    return False, f"Failed to set {label} to: {mode}"
 
 
 def main():
     """Main CLI entry point."""
-    parser = argparse.ArgumentParser(
-        description='Ecobee Web Automation CLI',
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-        epilog="""
-Examples:
-  %(prog)s status                    # Get current thermostat status
-  %(prog)s set-mode heat            # Set heating mode to 'heat'
-  %(prog)s set-temp 72              # Set target temperature to 72°F
-  %(prog)s --headless=false status  # Run with visible browser
-        """
-    )
-    
-    # Global options
-    parser.add_argument('--log-level', choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
-                       default='INFO', help='Set logging level')
-    parser.add_argument('--headless', type=str, choices=['true', 'false'],
-                       help='Run browser in headless mode')
-    parser.add_argument('--config-dir', help='Path to configuration directory')
     parser = argparse.ArgumentParser(
         description='Ecobee Web Automation CLI - Control heating mode for both thermostats',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -115,6 +67,7 @@ Examples:
   %(prog)s upstairs-aux             # Set Upstairs to Aux
   %(prog)s upstairs-heat            # Set Upstairs to Heat
   %(prog)s --headless=true main-floor-aux  # Set Main Floor to Aux with headless browser
+  %(prog)s --force-login main-floor-aux    # Ignore the saved session and log in again
         """
     )
     
@@ -124,21 +77,15 @@ Examples:
     parser.add_argument('--headless', type=str, choices=['true', 'false'],
                        help='Run browser in headless mode')
     parser.add_argument('--config-dir', help='Path to configuration directory')
+    parser.add_argument('--force-login', action='store_true',
+                       help='Log in again even if the saved browser session is still valid')
     
     # Subcommands
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Main Floor Aux command
-    main_floor_aux_parser = subparsers.add_parser('main-floor-aux', help='Set Main Floor heating mode to Aux')
-    
-    # Main Floor Heat command
-    main_floor_heat_parser = subparsers.add_parser('main-floor-heat', help='Set Main Floor heating mode to Heat')
-    
-    # Upstairs Aux command
-    upstairs_aux_parser = subparsers.add_parser('upstairs-aux', help='Set Upstairs heating mode to Aux')
-    
-    # Upstairs Heat command
-    upstairs_heat_parser = subparsers.add_parser('upstairs-heat', help='Set Upstairs heating mode to Heat')
+    for command, preset in COMMANDS.items():
+        label, mode = PRESETS[preset]
+        subparsers.add_parser(command, help=f'Set {label} heating mode to {mode.capitalize()}')
     
     args = parser.parse_args()
     
@@ -151,6 +98,9 @@ Examples:
         parser.print_help()
         return 1
     
+    # Imported here so --help and usage errors don't pay for loading Selenium
+    from src.ecobee_automation import EcobeeAutomation
+    
     try:
         # Load configuration
         config = ConfigManager(args.config_dir)
@@ -160,9 +110,8 @@ Examples:
             config.set('webdriver.headless', args.headless.lower() == 'true')
         
         # Validate required configuration
-        has_credentials = config.get('ecobee.username') is not None and config.get('ecobee.password') is not None
-        
-        if not has_credentials:
+        if not (config.has_required(['ecobee.username', 'ecobee.password'])
+                or config.get('ecobee.onepassword_item')):
             logger.error("Configuration error: No credentials configured")
             logger.error("Please set ECOBEE_USERNAME and ECOBEE_PASSWORD in your .secrets file")
             logger.error("(Create /Users/jakuboleksy/github/ecobee.control/.secrets if it doesn't exist)")
@@ -172,26 +121,23 @@ Examples:
         with EcobeeAutomation(config) as automation:
             # Login
             logger.info("Logging into ecobee...")
-            if not automation.login():
+            if not automation.login(force=args.force_login):
                 logger.error("Failed to login to ecobee")
                 return 1
             
             logger.info("Login successful")
             
             # Execute command
-            if args.command == 'main-floor-aux':
-                return cmd_main_floor_aux(args, automation)
-            elif args.command == 'main-floor-heat':
-                return cmd_main_floor_heat(args, automation)
-            elif args.command == 'upstairs-aux':
-                return cmd_upstairs_aux(args, automation)
-            elif args.command == 'upstairs-heat':
-                return cmd_upstairs_heat(args, automation)
-            else:
-                logger.error(f"Unknown command: {args.command}")
+            try:
+                success, message = run_command(automation, args.command)
+            except Exception as e:
+                print(f"Error setting mode: {e}")
                 return 1
+            
+            print(message)
+            return 0 if success else 1
     except Exception as e:
-        logger.error(f"Unexpected error: {e}")
+        logger.error("Unexpected error: %s", e)
         return 1
 
 
@@ -0,0 +1,27 @@
+"""
+Gunicorn configuration for the Ecobee API server
+
+Run with: gunicorn -c gunicorn_conf.py api_server:app
+"""
+
+import os
+
+from src.config_manager import ConfigManager
+
+bind = f"0.0.0.0:{os.environ.get('API_PORT', 5000)}"
+
+# A single worker process owns the shared browser session and command queue;
+# extra threads keep /health and queued requests responsive while a command runs.
+# Do not enable preload_app: the automation worker thread must start in the worker.
+workers = 1
+worker_class = 'gthread'
+# Each running or queued command holds a thread while it waits for its result,
+# so size the pool from api.queue_size: one for the running command, one per
+# queue slot, and two spare so /health and 429 responses are never starved
+threads = int(ConfigManager().get('api.queue_size', 5)) + 3
+
+# Allow for a queued command plus login before the worker is considered hung
+timeout = 180
+
+loglevel = os.environ.get('LOG_LEVEL', 'INFO').lower()
+accesslog = '-'
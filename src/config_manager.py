@@ -6,10 +6,131 @@ and provides a unified interface for accessing settings.
 """
 
 import os
+import re
+import copy
+import io
+import functools
 import yaml
 import logging
-from typing import Any, Dict, Optional, Union
-from dotenv import load_dotenv
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple, Union
+from dotenv import dotenv_values
+
+logger = logging.getLogger(__name__)
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Environment variables mapped to config keys
+ENV_MAPPINGS = {
+    'ECOBEE_USERNAME': 'ecobee.username',
+    'ECOBEE_PASSWORD': 'ecobee.password',
+    'ECOBEE_2FA_CODE': 'ecobee.two_factor_code',
+    'ECOBEE_ONEPASSWORD_ITEM': 'ecobee.onepassword_item',
+    'ECOBEE_THERMOSTAT_NAME': 'ecobee.thermostat_name',
+    'WEBDRIVER_HEADLESS': 'webdriver.headless',
+    'WEBDRIVER_EXPLICIT_WAIT': 'webdriver.explicit_wait',
+    'WEBDRIVER_PAGE_LOAD_TIMEOUT': 'webdriver.page_load_timeout',
+    'AUTOMATION_DELAY': 'automation.delay',
+    'MAX_RETRY_ATTEMPTS': 'automation.max_retry_attempts',
+    'SCREENSHOT_ON_ERROR': 'automation.screenshot_on_error',
+    'LOG_LEVEL': 'logging.level',
+    'LOG_FILE': 'logging.file',
+}
+
+# Parsed config and env files: path -> (mtime_ns, contents). Lets repeated
+# ConfigManager construction in one process skip re-parsing unchanged files.
+_CONFIG_CACHE: Dict[str, Tuple[int, Any]] = {}
+
+
+def _parse_cached(path: str, parse: Callable[[str], Any]) -> Any:
+    """Return the cached parse of a file, parsing only when its mtime changes.
+    
+    The result is shared with the cache and must not be modified.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    mtime_ns = os.stat(path).st_mtime_ns
+    cached = _CONFIG_CACHE.get(path)
+    if cached is None or cached[0] != mtime_ns:
+        cached = (mtime_ns, parse(path))
+        _CONFIG_CACHE[path] = cached
+    return cached[1]
+
+
+def _load_cached(path: str, parse: Callable[[str], Any]) -> Any:
+    """Return a copy of the parsed file, parsing only when its mtime changes.
+    
+    Raises:
+        FileNotFoundError: If the file does not exist
+    """
+    return copy.deepcopy(_parse_cached(path, parse))
+
+
+def _needs_parse(path: str) -> bool:
+    """Check whether a file exists and is missing from (or stale in) the cache."""
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except FileNotFoundError:
+        return False
+    cached = _CONFIG_CACHE.get(path)
+    return cached is None or cached[0] != mtime_ns
+
+
+@functools.lru_cache(maxsize=256)
+def _split_key(key: str) -> Tuple[str, ...]:
+    """Split a dot notation key into its parts (cached for repeated lookups)."""
+    return tuple(key.split('.'))
+
+
+# Config keys matching this are masked in str(ConfigManager)
+_SENSITIVE_RE = re.compile(r'password|key|secret|token', re.IGNORECASE)
+
+
+@functools.lru_cache(maxsize=256)
+def _is_sensitive(key: str) -> bool:
+    """Check whether a config key holds a secret (cached for repeated str() calls)."""
+    return _SENSITIVE_RE.search(key) is not None
+
+
+def _write_masked(out: io.StringIO, data: Dict[str, Any]) -> None:
+    """Write data to out formatted like a dict repr, masking sensitive values.
+    
+    Streams in a single pass instead of building a masked copy of the config.
+    """
+    out.write('{')
+    for i, (k, v) in enumerate(data.items()):
+        if i:
+            out.write(', ')
+        out.write(repr(k))
+        out.write(': ')
+        if isinstance(v, dict):
+            _write_masked(out, v)
+        elif _is_sensitive(k):
+            out.write(repr('*' * len(str(v)) if v else None))
+        else:
+            out.write(repr(v))
+    out.write('}')
+
+
+# String values converted by ConfigManager._convert_value
+_BOOL_VALUES = {
+    'true': True, 'yes': True, '1': True, 'on': True,
+    'false': False, 'no': False, '0': False, 'off': False,
+}
+_INT_RE = re.compile(r'[+-]?\d+')
+_FLOAT_RE = re.compile(r'[+-]?(?:\d+\.\d*|\.\d+)(?:[eE][+-]?\d+)?')
+
+
+def _parse_yaml(path: str) -> Any:
+    """Parse a YAML file."""
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_SafeLoader)
 
 
 class ConfigManager:
@@ -21,8 +142,6 @@ class ConfigManager:
         Args:
             config_dir: Directory containing config files. Defaults to ../config
         """
-        self.logger = logging.getLogger(__name__)
-        
         # Set up paths
         if config_dir is None:
             current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -30,6 +149,8 @@ class ConfigManager:
         
         self.config_dir = config_dir
         self.config_data: Dict[str, Any] = {}
+        # Dot notation key -> value for every nested key, built on first get()
+        self._flat: Optional[Dict[str, Any]] = None
         
         # Load configuration (config files first, then env vars override)
         self._load_config_files()
@@ -40,106 +161,113 @@ class ConfigManager:
         try:
             # Load from .env file if it exists (for configuration)
             env_file = os.path.join(os.path.dirname(self.config_dir), '.env')
-            if os.path.exists(env_file):
-                load_dotenv(env_file)
-                self.logger.info(f"Loaded environment from: {env_file}")
+            if self._apply_env_file(env_file, override=False):
+                logger.info(f"Loaded environment from: {env_file}")
             
             # Load from .secrets file if it exists (for credentials - not checked into git)
             secrets_file = os.path.join(os.path.dirname(self.config_dir), '.secrets')
-            if os.path.exists(secrets_file):
-                load_dotenv(secrets_file, override=True)  # Override with secrets
-                self.logger.info(f"Loaded secrets from: {secrets_file}")
+            if self._apply_env_file(secrets_file, override=True):  # Override with secrets
+                logger.info(f"Loaded secrets from: {secrets_file}")
             
-            # Map environment variables to config keys
-            env_mappings = {
-                'ECOBEE_USERNAME': 'ecobee.username',
-                'ECOBEE_PASSWORD': 'ecobee.password',
-                'ECOBEE_2FA_CODE': 'ecobee.two_factor_code',
-                'ECOBEE_ONEPASSWORD_ITEM': 'ecobee.onepassword_item',
-                'ECOBEE_THERMOSTAT_NAME': 'ecobee.thermostat_name',
-                'WEBDRIVER_HEADLESS': 'webdriver.headless',
-                'WEBDRIVER_IMPLICIT_WAIT': 'webdriver.implicit_wait',
-                'WEBDRIVER_PAGE_LOAD_TIMEOUT': 'webdriver.page_load_timeout',
-                'AUTOMATION_DELAY': 'automation.delay',
-                'MAX_RETRY_ATTEMPTS': 'automation.max_retry_attempts',
-                'SCREENSHOT_ON_ERROR': 'automation.screenshot_on_error',
-                'LOG_LEVEL': 'logging.level',
-                'LOG_FILE': 'logging.file',
-            }
+            # Only visit mapped variables that are actually set
+            for env_var in ENV_MAPPINGS.keys() & os.environ.keys():
+                # Convert string values to appropriate Python types
+                converted_value = self._convert_value(os.environ[env_var])
+                self._set_nested_key(self.config_data, ENV_MAPPINGS[env_var], converted_value)
             
-            for env_var, config_key in env_mappings.items():
-                value = os.getenv(env_var)
-                if value is not None:
-                    # Convert string values to appropriate types
-                    converted_value = self._convert_value(value)
-                    self._set_nested_key(self.config_data, config_key, converted_value)
-            
-        except Exception as e:
-            self.logger.warning(f"Failed to load environment variables: {e}")
+        except OSError as e:
+            logger.warning(f"Failed to load environment variables: {e}")
 
     def _load_config_files(self) -> None:
         """Load configuration from YAML files."""
-        try:
-            config_files = ['default.yml', 'config.yml', 'local.yml']
+        config_files = ['default.yml', 'config.yml', 'local.yml']
+        config_paths = [os.path.join(self.config_dir, f) for f in config_files]
+        
+        # Parse files that aren't cached yet concurrently, then merge in order.
+        # Only fill the cache here; the merge below takes the one copy it needs.
+        # A file that fails to parse is not cached, so the merge loop retries
+        # it and reports the error for that file alone.
+        stale_paths = [path for path in config_paths if _needs_parse(path)]
+        if len(stale_paths) > 1:
+            with ThreadPoolExecutor(max_workers=len(stale_paths)) as executor:
+                for path in stale_paths:
+                    executor.submit(_parse_cached, path, _parse_yaml)
+        
+        for config_path in config_paths:
+            try:
+                file_config = _load_cached(config_path, _parse_yaml)
+            except FileNotFoundError:
+                continue
+            except (OSError, yaml.YAMLError) as e:
+                logger.warning(f"Failed to load config file {config_path}: {e}")
+                continue
+            if file_config:
+                self._merge_config(self.config_data, file_config)
+                logger.info(f"Loaded config from: {config_path}")
+
+    def _apply_env_file(self, path: str, override: bool) -> bool:
+        """Copy variables from a dotenv file into os.environ.
+        
+        Args:
+            path: Path to the dotenv file
+            override: Replace variables that are already set
             
-            for config_file in config_files:
-                config_path = os.path.join(self.config_dir, config_file)
-                if os.path.exists(config_path):
-                    with open(config_path, 'r') as f:
-                        file_config = yaml.safe_load(f)
-                        if file_config:
-                            self._merge_config(self.config_data, file_config)
-                            self.logger.info(f"Loaded config from: {config_path}")
-                
-        except Exception as e:
-            self.logger.warning(f"Failed to load config files: {e}")
+        Returns:
+            bool: True if the file exists and was applied
+        """
+        try:
+            values = _load_cached(path, dotenv_values)
+        except FileNotFoundError:
+            return False
+        
+        for name, value in values.items():
+            if value is not None and (override or name not in os.environ):
+                os.environ[name] = value
+        return True
 
     def _convert_value(self, value: str) -> Union[str, int, float, bool]:
         """Convert string value to appropriate Python type."""
         if not isinstance(value, str):
             return value
         
+        stripped = value.strip()
+        
         # Boolean conversion
-        if value.lower() in ('true', 'yes', '1', 'on'):
-            return True
-        elif value.lower() in ('false', 'no', '0', 'off'):
-            return False
+        flag = _BOOL_VALUES.get(stripped.lower())
+        if flag is not None:
+            return flag
         
-        # Numeric conversion
-        try:
-            if '.' in value:
-                return float(value)
-            else:
-                return int(value)
-        except ValueError:
-            pass
+        # Numeric conversion, checked up front instead of catching ValueError
+        if _INT_RE.fullmatch(stripped):
+            return int(stripped)
+        if _FLOAT_RE.fullmatch(stripped):
+            return float(stripped)
         
         # Return as string if no conversion applies
         return value
 
     def _set_nested_key(self, data: Dict[str, Any], key: str, value: Any) -> None:
         """Set a nested key in a dictionary using dot notation."""
-        keys = key.split('.')
+        keys = _split_key(key)
         current = data
         
         for k in keys[:-1]:
-            if k not in current:
-                current[k] = {}
-            current = current[k]
+            current = current.setdefault(k, {})
         
         current[keys[-1]] = value
 
-    def _get_nested_key(self, data: Dict[str, Any], key: str, default: Any = None) -> Any:
-        """Get a nested key from a dictionary using dot notation."""
-        keys = key.split('.')
-        current = data
-        
-        try:
-            for k in keys:
-                current = current[k]
-            return current
-        except (KeyError, TypeError):
-            return default
+    def _build_flat(self) -> Dict[str, Any]:
+        """Index every key (leaves and sections) of config_data by its dot notation path."""
+        flat: Dict[str, Any] = {}
+        stack = [('', self.config_data)]
+        while stack:
+            prefix, data = stack.pop()
+            for k, v in data.items():
+                key = f"{prefix}{k}"
+                flat[key] = v
+                if isinstance(v, dict):
+                    stack.append((f"{key}.", v))
+        return flat
 
     def _merge_config(self, base: Dict[str, Any], override: Dict[str, Any]) -> None:
         """Recursively merge configuration dictionaries."""
@@ -159,7 +287,10 @@ class ConfigManager:
         Returns:
             Configuration value or default
         """
-        return self._get_nested_key(self.config_data, key, default)
+        if self._flat is None:
+            self._flat = self._build_flat()
+        value = self._flat.get(key)
+        return default if value is None else value
 
     def set(self, key: str, value: Any) -> None:
         """Set a configuration value using dot notation.
@@ -169,6 +300,7 @@ class ConfigManager:
             value: Value to set
         """
         self._set_nested_key(self.config_data, key, value)
+        self._flat = None
 
     def get_section(self, section: str) -> Dict[str, Any]:
         """Get an entire configuration section.
@@ -181,6 +313,19 @@ class ConfigManager:
         """
         return self.get(section, {})
 
+    def has_required(self, required_keys: list) -> bool:
+        """Check that required configuration keys are present.
+        
+        Stops at the first missing key.
+        
+        Args:
+            required_keys: List of required configuration keys
+            
+        Returns:
+            bool: True if every key has a value
+        """
+        return all(self.get(key) is not None for key in required_keys)
+
     def validate_required(self, required_keys: list) -> None:
         """Validate that required configuration keys are present.
         
@@ -190,13 +335,8 @@ class ConfigManager:
         Raises:
             ValueError: If any required key is missing
         """
-        missing_keys = []
-        
-        for key in required_keys:
-            if self.get(key) is None:
-                missing_keys.append(key)
-        
-        if missing_keys:
+        if not self.has_required(required_keys):
+            missing_keys = [key for key in required_keys if self.get(key) is None]
             raise ValueError(f"Missing required configuration keys: {missing_keys}")
 
     def to_dict(self) -> Dict[str, Any]:
@@ -205,20 +345,6 @@ class ConfigManager:
 
     def __str__(self) -> str:
         """String representation of configuration (without sensitive data)."""
-        safe_config = self.to_dict()
-        
-        # Mask sensitive keys
-        sensitive_keys = ['password', 'key', 'secret', 'token']
-        
-        def mask_sensitive(data: Dict[str, Any]) -> Dict[str, Any]:
-            masked = {}
-            for k, v in data.items():
-                if isinstance(v, dict):
-                    masked[k] = mask_sensitive(v)
-                elif any(sensitive in k.lower() for sensitive in sensitive_keys):
-                    masked[k] = '*' * len(str(v)) if v else None
-                else:
-                    masked[k] = v
-            return masked
-        
-        return str(mask_sensitive(safe_config))
\ No newline at end of file
+        out = io.StringIO()
+        _write_masked(out, self.config_data)
+        return out.getvalue()
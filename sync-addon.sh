@@ -18,6 +18,9 @@ echo "✓ Copied cli.py"
 cp api_server.py addon/
 echo "✓ Copied api_server.py"
 
+cp gunicorn_conf.py addon/
+echo "✓ Copied gunicorn_conf.py"
+
 # Copy dependencies
 cp requirements.txt addon/
 echo "✓ Copied requirements.txt"